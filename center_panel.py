@@ -1,45 +1,221 @@
 from PySide6.QtWidgets import QLabel
-from PySide6.QtGui import QPixmap
-from PySide6.QtCore import Qt
+from PySide6.QtGui import QPixmap, QImage, QImageReader, QImageIOHandler
+from collections import OrderedDict
+from PySide6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, Signal, Slot
+
+def decode_image(image_path, target_size):
+    """Decodes an image, letting the image plugin scale it down to target_size while decoding.
+
+    For JPEGs this scales in the DCT domain, which is much cheaper than decoding
+    full resolution and scaling afterwards. Only uses QImage, so it is safe to call off the GUI thread.
+
+    Returns:
+        tuple: (QImage, bool) - the image (null on failure) and whether it was decoded below full resolution
+    """
+    is_reduced = False
+    reader = QImageReader(image_path)
+    reader.setAutoTransform(True) # Respect EXIF orientation like QPixmap(path) does
+    original_size = reader.size()
+
+    if original_size.isValid() and target_size.width() > 0 and target_size.height() > 0:
+        # reader.size() is before the EXIF transform, so compare against the panel in the same orientation
+        if reader.transformation() & QImageIOHandler.TransformationRotate90:
+            target_size = target_size.transposed()
+        scaled_size = original_size.scaled(target_size, Qt.AspectRatioMode.KeepAspectRatio)
+        if scaled_size.width() < original_size.width() and scaled_size.height() < original_size.height():
+            reader.setScaledSize(scaled_size)
+            is_reduced = True
+
+    image = reader.read()
+    if image.isNull():
+        # Some formats can't report a size or decode scaled, fall back to a plain full decode
+        is_reduced = False
+        image = QImage(image_path)
+    return image, is_reduced
+
+class ImageDecodeSignals(QObject):
+    """Signals for the image decode worker."""
+    decoded = Signal(str, object, bool)  # image path, QImage, decoded below full resolution
+
+class ImageDecodeWorker(QRunnable):
+    """Decodes an image on a background thread so the GUI thread only has to convert and scale it."""
+
+    def __init__(self, image_path, target_size):
+        super().__init__()
+        self.image_path = image_path
+        self.target_size = target_size
+        self.signals = ImageDecodeSignals()
+
+    @Slot()
+    def run(self):
+        """Decodes the image and emits it."""
+        image, is_reduced = decode_image(self.image_path, self.target_size)
+        self.signals.decoded.emit(self.image_path, image, is_reduced)
 
 class CenterPanel(QLabel):
+    # Upper bound for the decoded images kept in memory for revisits and prefetching
+    IMAGE_CACHE_LIMIT_BYTES = 256 * 1024 * 1024
+
     def __init__(self):
         super().__init__()
         self.setAlignment(Qt.AlignCenter)  # Keep alignment from MainWindow
         self.image_path = None  # Store image path
         self.setText("No image loaded. Select a folder from the file menu")
 
+        # Decoded image for image_path, kept so resizes only rescale instead of decoding the file again.
+        # Kept as a QImage: only the scaled copy is converted to a QPixmap for display, never the full size image
+        self._source_image = None
+        self._source_path = None
+        self._source_is_reduced = False  # True when the source image was decoded below the file's full resolution
+        self._displayed_size = None  # Panel size the current scaled pixmap was made for
+
+        # Recently shown and prefetched images, least recently used first: path -> (QImage, is_reduced)
+        self._image_cache = OrderedDict()
+        self._image_cache_bytes = 0
+        self._prefetch_paths = []  # Paths the last prefetch_images call asked for
+        self._pending_decode_paths = set()  # Paths with a decode worker still running, for display or prefetching
+
+        # Resizes arrive in bursts while the window edge is dragged; rescale once the size settles
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(150)
+        self._resize_timer.timeout.connect(self.update_image_display)
+
         self.setFocusPolicy(Qt.ClickFocus)
 
     def set_image_path(self, image_path):
         """Sets the image path for the center panel."""
         self.image_path = image_path
+        self._displayed_size = None # The label may have been cleared or given text since the last display
         self.update_image_display() # Call to load initially if path is set programmatically
 
     def resizeEvent(self, event):
         """Handles resize events to scale and display the image."""
         super().resizeEvent(event) # Important: Call base class implementation first
-        self.update_image_display()
+        if self.image_path:
+            self._resize_timer.start() # Restarting the timer debounces the burst
+
+    def _get_source_image(self, target_size):
+        """Returns the decoded image for the current image path.
+
+        The file is only decoded again when the path changes, or when the panel has grown
+        past an image that was decoded at reduced size. Decoding happens on the thread pool,
+        so this returns None until the decode is done.
+        """
+        needs_decode = self._source_path != self.image_path
+        if not needs_decode and self._source_is_reduced:
+            source_size = self._source_image.size()
+            needed_size = source_size.scaled(target_size, Qt.AspectRatioMode.KeepAspectRatio)
+            needs_decode = needed_size.width() > source_size.width() # Would have to upscale the reduced decode
+
+        if needs_decode:
+            image, is_reduced = self._get_cached_image(self.image_path, target_size)
+            if image is None:
+                self._start_decode(self.image_path, target_size)
+                return None # _on_image_decoded displays it once decoded
+            self._set_source_image(self.image_path, image, is_reduced)
+        return self._source_image
+
+    def _set_source_image(self, image_path, image, is_reduced):
+        """Makes a decoded image the source that gets scaled for display."""
+        self._source_image = image
+        self._source_is_reduced = is_reduced
+        self._source_path = image_path
+        self._displayed_size = None
+
+    def _start_decode(self, image_path, target_size):
+        """Starts a background decode of image_path unless one is already running."""
+        if image_path in self._pending_decode_paths:
+            return # The running decode is picked up by _on_image_decoded
+        worker = ImageDecodeWorker(image_path, target_size)
+        worker.signals.decoded.connect(self._on_image_decoded)
+        self._pending_decode_paths.add(image_path)
+        QThreadPool.globalInstance().start(worker)
+
+    def _get_cached_image(self, image_path, target_size):
+        """Returns a cached (QImage, is_reduced) for image_path if it is big enough for target_size.
+
+        Returns (None, False) when there is no usable cached image.
+        """
+        cached = self._image_cache.get(image_path)
+        if cached is None:
+            return None, False
+        image, is_reduced = cached
+        if is_reduced:
+            needed_size = image.size().scaled(target_size, Qt.AspectRatioMode.KeepAspectRatio)
+            if needed_size.width() > image.width():
+                return None, False # Panel grew since it was decoded, decode again at the new size
+        self._image_cache.move_to_end(image_path) # Mark as most recently used
+        return image, is_reduced
+
+    def _cache_image(self, image_path, image, is_reduced):
+        """Stores a decoded image, evicting the least recently used ones past IMAGE_CACHE_LIMIT_BYTES."""
+        if image.isNull():
+            return # Let the next display decode again and produce the error state
+        self._drop_cached_image(image_path)
+        self._image_cache[image_path] = (image, is_reduced)
+        self._image_cache_bytes += image.sizeInBytes()
+        while self._image_cache_bytes > self.IMAGE_CACHE_LIMIT_BYTES and len(self._image_cache) > 1:
+            self._drop_cached_image(next(iter(self._image_cache)))
+
+    def _drop_cached_image(self, image_path):
+        """Removes an image from the cache, if present."""
+        cached = self._image_cache.pop(image_path, None)
+        if cached is not None:
+            self._image_cache_bytes -= cached[0].sizeInBytes()
+
+    def prefetch_images(self, image_paths):
+        """Decodes the given images on the thread pool so navigating to them doesn't block on disk and decode."""
+        self._prefetch_paths = [path for path in image_paths if path and path != self.image_path]
+
+        for path in self._prefetch_paths:
+            if path not in self._image_cache:
+                self._start_decode(path, self.size())
+
+    @Slot(str, object, bool)
+    def _on_image_decoded(self, image_path, image, is_reduced):
+        """Displays a decoded image if it is the current one, and caches it if it is still wanted."""
+        self._pending_decode_paths.discard(image_path)
+        if image_path == self.image_path:
+            self._cache_image(image_path, image, is_reduced)
+            self._set_source_image(image_path, image, is_reduced)
+            self.update_image_display()
+        elif image_path in self._prefetch_paths:
+            self._cache_image(image_path, image, is_reduced)
 
     def update_image_display(self):
         """Loads and scales the image to fit the center panel."""
         if not self.image_path:
+            self._source_image = None
+            self._source_path = None
+            self._source_is_reduced = False
+            self._displayed_size = None
             self.setText("No image loaded. Select a folder from the file menu")
             return
 
-        pixmap = QPixmap(self.image_path)
+        panel_size = self.size()
+        source_image = self._get_source_image(panel_size)
+
+        if source_image is None:
+            # Still decoding. The rest of the window already shows this image's tags, so don't leave the
+            # previous picture up meanwhile. A same-image redecode for a bigger panel keeps the smaller scale shown
+            if self._source_path != self.image_path:
+                self.setText("Loading image...")
+                self._displayed_size = None
+            return
 
-        if pixmap.isNull():
+        if source_image.isNull():
             self.setText("Error loading image") # Keep error text from MainWindow
             return
 
-        panel_width = self.width()
-        panel_height = self.height()
+        if panel_size == self._displayed_size:
+            return # Already showing this image scaled for the current size
 
-        scaled_pixmap = pixmap.scaled(
-            panel_width,
-            panel_height,
+        scaled_image = source_image.scaled(
+            panel_size.width(),
+            panel_size.height(),
             Qt.AspectRatioMode.KeepAspectRatio,
             Qt.TransformationMode.SmoothTransformation
         )
-        self.setPixmap(scaled_pixmap)
\ No newline at end of file
+        self.setPixmap(QPixmap.fromImage(scaled_image))
+        self._displayed_size = panel_size
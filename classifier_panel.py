@@ -1,7 +1,8 @@
 # classifier_panel.py
+import logging
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
                              QScrollArea, QFrame, QMenu, QDoubleSpinBox, QComboBox, QApplication, QGraphicsOpacityEffect)
-from PySide6.QtCore import Qt, Slot, QSize, Signal
+from PySide6.QtCore import Qt, Slot, QSize, Signal, QTimer
 from PySide6.QtGui import QAction, QIcon
 
 # Import TagWidget - it will be needed for placeholder logic
@@ -9,6 +10,8 @@ from tag_widget import TagWidget
 from tag_list_model import TagData
 from file_operations import FileOperations
 
+logger = logging.getLogger(__name__)
+
 class ClassifierPanel(QWidget):
     # Custom signals
     auto_analyze_toggled = Signal(bool)  # Emits True when enabled, False when disabled
@@ -18,6 +21,7 @@ class ClassifierPanel(QWidget):
         self.main_window = main_window
         self.classifier_manager = classifier_manager
         self.raw_results: list[tuple[str, float]] | None = None
+        self.result_widgets_by_name = {}  # Tag name -> TagWidget currently shown, reused across threshold changes
 
         print("ClassifierPanel Initialized") # Basic check
 
@@ -141,8 +145,12 @@ class ClassifierPanel(QWidget):
         self.classifier_manager.analysis_finished.connect(self._on_analysis_finished)
         self.classifier_manager.error_occurred.connect(self._on_analysis_error)
 
-        self.threshold_spinbox.valueChanged.connect(self._update_displayed_tags)
-        self.threshold_spinbox.valueChanged.connect(self._save_threshold_setting)
+        # Holding an arrow key on the spinbox emits valueChanged rapidly; coalesce into one refresh + config save
+        self.threshold_timer = QTimer(self)
+        self.threshold_timer.setSingleShot(True)
+        self.threshold_timer.setInterval(120)
+        self.threshold_timer.timeout.connect(self._apply_threshold_change)
+        self.threshold_spinbox.valueChanged.connect(lambda _value: self.threshold_timer.start()) # Restart, don't pass the value as an interval
 
         self.model_selector.textActivated.connect(self._handle_model_selection_changed)
 
@@ -153,15 +161,22 @@ class ClassifierPanel(QWidget):
 
     def _clear_results_widgets(self):
         """Helper to clear existing widgets from the results layout."""
-        for i in reversed(range(self.results_layout.count())):
-            widget_item = self.results_layout.itemAt(i)
-            if widget_item is not None:
-                widget = widget_item.widget()
-                if widget is not None:
-                    if hasattr(widget, 'cleanup'):
-                        widget.cleanup()
-                    self.results_layout.removeWidget(widget)
-                    widget.deleteLater()
+        self.result_widgets_by_name = {}
+        if self.results_layout.count() == 0:
+            return # Already empty, e.g. navigating between images without analysis results
+        self.results_container.setUpdatesEnabled(False) # One relayout for the whole teardown
+        try:
+            for i in reversed(range(self.results_layout.count())):
+                widget_item = self.results_layout.itemAt(i)
+                if widget_item is not None:
+                    widget = widget_item.widget()
+                    if widget is not None:
+                        if hasattr(widget, 'cleanup'):
+                            widget.cleanup()
+                        self.results_layout.takeAt(i) # By index; removeWidget would search the layout for the widget
+                        widget.deleteLater()
+        finally:
+            self.results_container.setUpdatesEnabled(True)
 
     def _handle_analyze_clicked(self):
         """Handles clicks on the 'Analyze' button."""
@@ -271,9 +286,7 @@ class ClassifierPanel(QWidget):
             return
 
         current_threshold = self.threshold_spinbox.value()
-        print(f"Updating display based on threshold: {current_threshold:.2f}")
-
-        self._clear_results_widgets() # Clear previous widgets
+        logger.debug("Updating display based on threshold: %.2f", current_threshold)
 
         # --- Filter results based on current threshold ---
         filtered_results = [
@@ -281,9 +294,9 @@ class ClassifierPanel(QWidget):
             if score >= current_threshold
         ]
 
-        # --- Populate results area with filtered results ---
+        # --- Resolve TagData for the filtered results ---
         tag_model = self.main_window.tag_list_model
-        widgets_added = 0
+        wanted_results = [] # (tag_data, score) in display order
         for tag_name, score in filtered_results:
             tag_data = tag_model.tags_by_name.get(tag_name)
             if tag_data is None:
@@ -291,17 +304,18 @@ class ClassifierPanel(QWidget):
                 tag_model.add_tag(tag_data)
 
             if tag_data:
-                tag_widget = TagWidget(tag_data=tag_data)
-                tag_widget.setToolTip(f"Confidence: {score:.2%}")
-                tag_widget.set_styling_mode("dim_on_select")
-                tag_widget.tag_clicked.connect(self.main_window._handle_tag_clicked)
-                tag_widget.favorite_star_clicked.connect(self.main_window._handle_favorite_star_clicked)
-                tag_widget.tag_right_clicked.connect(self._handle_tag_right_clicked)
-                self.results_layout.addWidget(tag_widget)
-                widgets_added += 1
+                wanted_results.append((tag_data, score))
             else:
                 print(f"Error: Failed to get or create TagData for '{tag_name}'")
 
+        # --- Update results area ---
+        # Freeze repaints while widgets are added/moved so the results are laid out and painted once
+        self.results_container.setUpdatesEnabled(False)
+        try:
+            widgets_added = self._sync_result_widgets(wanted_results)
+        finally:
+            self.results_container.setUpdatesEnabled(True)
+
         # --- Update status label ---
         if widgets_added > 0:
             self.status_label.setText(f"Displaying {widgets_added} suggestions")
@@ -309,7 +323,7 @@ class ClassifierPanel(QWidget):
             if self.raw_results: # Check if analysis actually ran
                 self.status_label.setText(f"No suggestions above threshold {current_threshold:.2f}")
             # else: status is likely "Ready" or "Loading", don't overwrite
-        print(f"Displayed {widgets_added} widgets.")
+        logger.debug("Displayed %s widgets.", widgets_added)
 
         # --- Update button states ---
         # Enable if there are filtered results, disable otherwise
@@ -317,9 +331,44 @@ class ClassifierPanel(QWidget):
         self._set_copy_button_enabled(has_filtered_results)
         self._set_bulk_add_button_enabled(has_filtered_results)
 
+    def _sync_result_widgets(self, wanted_results):
+        """Helper to bring the results layout in line with wanted_results, reusing widgets for tags that stay above the threshold.
+
+        Args:
+            wanted_results (list): (TagData, score) tuples in display order
+
+        Returns:
+            int: Number of result widgets shown
+        """
+        wanted_tags = {tag_data.name: tag_data for tag_data, score in wanted_results}
+        for tag_name, tag_widget in list(self.result_widgets_by_name.items()):
+            if wanted_tags.get(tag_name) is not tag_widget.tag_data:
+                del self.result_widgets_by_name[tag_name]
+                tag_widget.cleanup()
+                self.results_layout.removeWidget(tag_widget)
+                tag_widget.deleteLater()
+
+        widgets_added = 0
+        for index, (tag_data, score) in enumerate(wanted_results):
+            tag_widget = self.result_widgets_by_name.get(tag_data.name)
+            if tag_widget is None:
+                tag_widget = TagWidget(tag_data=tag_data)
+                tag_widget.set_styling_mode("dim_on_select")
+                tag_widget.tag_clicked.connect(self.main_window._handle_tag_clicked)
+                tag_widget.favorite_star_clicked.connect(self.main_window._handle_favorite_star_clicked)
+                tag_widget.tag_right_clicked.connect(self._handle_tag_right_clicked)
+                self.result_widgets_by_name[tag_data.name] = tag_widget
+                self.results_layout.insertWidget(index, tag_widget)
+            elif self.results_layout.indexOf(tag_widget) != index:
+                self.results_layout.removeWidget(tag_widget)
+                self.results_layout.insertWidget(index, tag_widget)
+            tag_widget.setToolTip(f"Confidence: {score:.2%}")
+            widgets_added += 1
+        return widgets_added
+
     def clear_results(self):
         """Clears the results area and resets the status label."""
-        print("ClassifierPanel: Clearing results.")
+        logger.debug("ClassifierPanel: Clearing results.")
         self.raw_results = None
         self._clear_results_widgets()
         self.status_label.setText("Ready (New Image)")
@@ -470,6 +519,12 @@ class ClassifierPanel(QWidget):
         else:
             print(f"  No context actions applicable for tag '{tag_name}'")
     
+    @Slot()
+    def _apply_threshold_change(self):
+        """Refreshes the displayed results and saves the threshold once the spinbox value has settled."""
+        self._update_displayed_tags()
+        self._save_threshold_setting(self.threshold_spinbox.value())
+
     @Slot(float) # Use float since spinbox emits float
     def _save_threshold_setting(self, value):
         """Saves the new threshold value to the config file."""
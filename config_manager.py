@@ -1,21 +1,26 @@
 import os
 import json
+from file_operations import DATA_DIR
 
 class ConfigManager:
     """Manages application configuration loading and saving."""
 
     def __init__(self):
-        self.config_path = os.path.join(os.getcwd(), "data", "config.json")
+        self.config_path = os.path.join(DATA_DIR, "config.json")
         self.default_config = {
             "last_opened_folder": "",
             "classifier_threshold": 0.30,
             "classifier_active_model_id": "JTP_PILOT2",
-            "tag_source": "e621"
+            "tag_source": "e621",
+            "export_skip_empty_tag_files": False
         }
         self.config = self._load_config()
 
     def _load_config(self):
-        """Loads the configuration from config.json, creating it with defaults if it doesn't exist."""
+        """Loads the configuration from config.json, falling back to the defaults if it doesn't exist.
+
+        Nothing is written here; config.json is created by the first set_config_value call.
+        """
         try:
             with open(self.config_path, 'r', encoding='utf-8') as f:
                 config = json.load(f)
@@ -25,14 +30,11 @@ class ConfigManager:
                         config[key] = value
                 return config
         except FileNotFoundError:
-            print("config.json not found, creating with defaults.")
-            # Create the file with default values
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.default_config, f, indent=2)  # Use indent for readability.
-            return self.default_config
+            print("config.json not found, using defaults.")
+            return dict(self.default_config) # Copy, so set_config_value doesn't change the defaults
         except json.JSONDecodeError:
             print("Error decoding config.json. Using default values.")
-            return self.default_config
+            return dict(self.default_config)
 
     def save_config(self):
         """Saves the configuration to config.json."""
@@ -47,6 +49,11 @@ class ConfigManager:
         return self.config.get(key)
 
     def set_config_value(self, key, value):
-        """Sets a configuration value and saves the config file."""
+        """Sets a configuration value and saves the config file.
+
+        Setting a key to the value it already has doesn't touch the file, e.g. reopening the same folder.
+        """
+        if key in self.config and self.config[key] == value:
+            return
         self.config[key] = value
         self.save_config()
\ No newline at end of file
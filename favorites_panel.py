@@ -3,6 +3,8 @@ from PySide6.QtGui import QAction
 from tag_list_panel import TagListPanel
 
 class FavoritesPanel(TagListPanel):
+    TAGS_DRAGGABLE = True # Tags can be reordered by dragging
+
     def __init__(self, main_window, parent=None):
         super().__init__(main_window, panel_title="Favorites")
         self.setAcceptDrops(True)  # This panel accepts drops
@@ -16,7 +18,7 @@ class FavoritesPanel(TagListPanel):
 
     def is_tag_draggable(self, tag_name):
         """Always allow dragging in this panel."""
-        return True
+        return self.TAGS_DRAGGABLE
 
     def _get_bulk_operations(self):
         """Returns list of allowed bulk operations for this panel."""
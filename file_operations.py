@@ -1,6 +1,167 @@
 import os
+import re
 import json
 import csv
+import logging
+from PySide6.QtCore import QObject, QRunnable, Signal, Slot
+
+logger = logging.getLogger(__name__)
+
+# App folders, relative to the working directory the app was started from. Resolved once at import
+# rather than calling os.getcwd() on every save (usage data is saved on each tag click)
+BASE_DIR = os.getcwd()
+DATA_DIR = os.path.join(BASE_DIR, "data")
+STAGING_DIR = os.path.join(BASE_DIR, "staging")
+OUTPUT_DIR = os.path.join(BASE_DIR, "output")
+FAVORITES_PATH = os.path.join(DATA_DIR, "favorites.json")
+USAGE_DATA_PATH = os.path.join(DATA_DIR, "usage_data.json")
+
+# Lowercase image suffixes (without the dot) recognised when scanning a folder
+IMAGE_EXTENSIONS = frozenset({'jpg', 'jpeg', 'png', 'gif', 'bmp'})
+
+# Matches filenames ending in one of the IMAGE_EXTENSIONS. One compiled search per name runs in C,
+# cheaper than slicing and lowercasing the suffix in Python on folders with many files
+_IMAGE_FILENAME_PATTERN = re.compile(r'\.(?:' + '|'.join(sorted(IMAGE_EXTENSIONS)) + r')\Z', re.IGNORECASE)
+
+# Splits a filename into digit and non-digit runs for natural sorting
+_split_digit_runs = re.compile('([0-9]+)').split
+
+def scan_image_folder(folder_path):
+    """Lists a folder's images and .txt tag files in one directory pass.
+
+    Doesn't touch any FileOperations state, so it is safe to call off the GUI thread.
+
+    Returns:
+        tuple: (folder mtime_ns read before the scan, naturally sorted image paths, set of normcased .txt filenames)
+
+    Raises:
+        FileNotFoundError: If the folder doesn't exist
+    """
+    # Read before listing, so a change during the scan leaves the result looking outdated rather than current
+    folder_mtime = os.stat(folder_path).st_mtime_ns
+
+    def natural_sort_key(s):
+        return [int(text) if text.isdigit() else text.lower() for text in _split_digit_runs(s)]
+
+    # One directory pass collects both the images and the .txt tag files next to them
+    image_entries = [] # (filename, path) pairs; DirEntry.path is already joined with folder_path
+    sidecar_names = set()
+    is_image_filename = _IMAGE_FILENAME_PATTERN.search
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            name = entry.name
+            if is_image_filename(name):
+                # is_file() uses the type the directory listing already returned, skipping e.g. folders named "x.jpg"
+                if entry.is_file():
+                    image_entries.append((name, entry.path))
+            elif name[-4:].lower() == '.txt':
+                sidecar_names.add(os.path.normcase(name))
+    image_entries.sort(key=lambda image_entry: natural_sort_key(image_entry[0]))
+    return folder_mtime, [path for _, path in image_entries], sidecar_names
+
+def find_sidecar_file(image_path, sidecar_names):
+    """Returns the path of the .txt tag file for an image, or None.
+
+    Prefers "name.txt" over "name.ext.txt". sidecar_names is the set of normcased .txt filenames
+    from scan_image_folder; without it (None) the candidates are checked with stat calls.
+    """
+    folder_path, image_filename = os.path.split(image_path)
+    # Image filenames always end in one of the IMAGE_EXTENSIONS, so cutting at the last dot strips it
+    # like splitext would, without its extra scans of the string (this runs per image in export and preload)
+    base_filename = image_filename.rpartition('.')[0]
+    tag_file_path_txt = image_path[:len(image_path) - len(image_filename)] + base_filename + ".txt"
+    tag_file_path_ext_txt = image_path + ".txt"
+
+    if sidecar_names is None:
+        if os.path.exists(tag_file_path_txt):
+            return tag_file_path_txt
+        if os.path.exists(tag_file_path_ext_txt):
+            return tag_file_path_ext_txt
+        return None
+
+    if os.path.normcase(base_filename + ".txt") in sidecar_names:
+        return tag_file_path_txt
+    if os.path.normcase(image_filename + ".txt") in sidecar_names:
+        return tag_file_path_ext_txt
+    return None
+
+def read_sidecar_tags(image_paths, sidecar_names, skip_image_paths=frozenset()):
+    """Reads the .txt tag files of the given images, in one pass.
+
+    Doesn't touch any FileOperations state, so it is safe to call off the GUI thread.
+
+    Args:
+        image_paths (list): Images whose tag files to read
+        sidecar_names (set): Normcased .txt filenames from scan_image_folder
+        skip_image_paths (frozenset): Images not to read, e.g. the ones the workfile already has tags for
+
+    Returns:
+        dict: Image path -> (tag file path, (mtime_ns, size) of the tag file, list of tags), for the images
+            that have a readable tag file. The stat result lets a later lookup notice the file was edited since
+    """
+    sidecar_tags_by_image = {}
+    for image_path in image_paths:
+        if image_path in skip_image_paths:
+            continue
+        tag_file_to_use = find_sidecar_file(image_path, sidecar_names)
+        if tag_file_to_use:
+            try:
+                # Stat before reading, so an edit during the read makes the entry look outdated rather than current
+                tag_file_stat = os.stat(tag_file_to_use)
+                tag_file_version = (tag_file_stat.st_mtime_ns, tag_file_stat.st_size)
+                sidecar_tags_by_image[image_path] = (tag_file_to_use, tag_file_version, FileOperations._read_tag_file(tag_file_to_use))
+            except Exception as e:
+                print(f"  Error reading tag file {tag_file_to_use}: {e}") # load_tags_for_image will try again
+    return sidecar_tags_by_image
+
+class FolderScanSignals(QObject):
+    """Signals for the folder scan worker."""
+    # folder path, scan_image_folder result (None if the folder doesn't exist), read_sidecar_tags result (None too)
+    scanned = Signal(str, object, object)
+
+class FolderScanWorker(QRunnable):
+    """Scans an image folder and reads its .txt tag files on a background thread, so opening a large folder doesn't freeze the window."""
+
+    def __init__(self, folder_path, workfile_image_paths=frozenset()):
+        super().__init__()
+        self.folder_path = folder_path
+        self.workfile_image_paths = workfile_image_paths # Images the workfile has tags for, their .txt files aren't read
+        self.signals = FolderScanSignals()
+
+    @Slot()
+    def run(self):
+        """Scans the folder, reads the tag files of the images found, and emits both."""
+        try:
+            scan_result = scan_image_folder(self.folder_path)
+        except OSError as e:
+            print(f"Error scanning folder {self.folder_path}: {e}")
+            self.signals.scanned.emit(self.folder_path, None, None)
+            return
+        _, image_paths, sidecar_names = scan_result
+        sidecar_tags_by_image = read_sidecar_tags(image_paths, sidecar_names, self.workfile_image_paths)
+        self.signals.scanned.emit(self.folder_path, scan_result, sidecar_tags_by_image)
+
+class WorkfileWriteSignals(QObject):
+    """Signals for the workfile write worker."""
+    write_failed = Signal(str)  # workfile path
+
+class WorkfileWriteWorker(QRunnable):
+    """Writes a snapshot of a workfile on a background thread, so tag changes never wait on the disk."""
+
+    def __init__(self, workfile_path, image_tags):
+        super().__init__()
+        self.workfile_path = workfile_path
+        self.image_tags = image_tags
+        self.signals = WorkfileWriteSignals()
+
+    @Slot()
+    def run(self):
+        """Writes the workfile, emitting write_failed if it couldn't be written."""
+        try:
+            FileOperations.write_workfile(self.workfile_path, {"image_tags": self.image_tags})
+        except OSError as e:
+            print(f"Error writing workfile {self.workfile_path}: {e}")
+            self.signals.write_failed.emit(self.workfile_path)
 
 class FileOperations:
     """Handles file system operations for the image tagger."""
@@ -8,7 +169,19 @@ class FileOperations:
     staging_folder_path = None  # Class variable for staging folder
 
     def __init__(self):
-        pass
+        # Folder path -> workfile path, filled by get_workfile_path (staging_folder_path is set once at startup)
+        self._workfile_paths_by_folder = {}
+        # Workfile path -> its "image_tags" dict, so navigation doesn't re-read the workfile from disk
+        self._workfile_cache = {}
+        # Workfile paths whose cached image_tags have changes not yet written by flush_workfiles
+        self._dirty_workfile_paths = set()
+        # Folder -> set of normcased .txt filenames, filled by the folder scan so tag file lookups don't stat
+        self._sidecar_names_by_folder = {}
+        # (folder key, folder mtime_ns, sorted image paths, .txt names) from the last _scan_image_folder call
+        self._last_folder_scan = None
+        # Image path -> (tag file path, (mtime_ns, size), tags) read at folder load (set_preloaded_sidecar_tags),
+        # for images without a workfile entry yet. The stat result is checked on use, in-place edits aren't reported by the watcher
+        self._sidecar_tags_by_image = {}
         
     def _load_json_file(self, file_path, default_value=None, create_if_missing=True):
         """Helper method to load JSON data from a file with standardized error handling.
@@ -52,10 +225,13 @@ class FileOperations:
             bool: True if saving succeeded, False otherwise
         """
         try:
-            # Ensure the directory exists
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
+            try:
+                f = open(file_path, 'w', encoding='utf-8')
+            except FileNotFoundError:
+                # Only create the directory when it's missing, this runs on every tag click (usage data)
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                f = open(file_path, 'w', encoding='utf-8')
+            with f:
                 json.dump(data, f, indent=indent)
             return True
         except Exception as e:
@@ -63,64 +239,153 @@ class FileOperations:
             return False
 
     def get_workfile_path(self, folder_path):
-        """Generates a valid workfile path based on the image folder path."""
-        filename_safe_string = folder_path.replace(os.sep, '_').replace(':', '_') + ".json"
-        return os.path.join(self.staging_folder_path, filename_safe_string)
+        """Generates a valid workfile path based on the image folder path.
 
-    def update_workfile(self, last_folder_path, image_path, tags):
-        """Updates the workfile with the tags for the given image."""
-        if last_folder_path:  # Only save if a folder has been loaded.
-            workfile_path = self.get_workfile_path(last_folder_path)
+        Called several times per tag click, so the result is remembered per folder.
+        """
+        workfile_path = self._workfile_paths_by_folder.get(folder_path)
+        if workfile_path is None:
+            filename_safe_string = folder_path.replace(os.sep, '_').replace(':', '_') + ".json"
+            workfile_path = os.path.join(self.staging_folder_path, filename_safe_string)
+            self._workfile_paths_by_folder[folder_path] = workfile_path
+        return workfile_path
 
-            tag_names = [tag.name for tag in tags]  # Extract tag names
+    def _get_cached_image_tags(self, folder_path):
+        """Returns the workfile's image_tags dict for folder_path, reading the workfile only on first use.
 
-            try:
-                with open(workfile_path, 'r+', encoding='utf-8') as f:
-                    data = json.load(f)
-                    data["image_tags"][image_path] = tag_names  # Use extracted tag names
-                    f.seek(0)
-                    json.dump(data, f, indent=2)
-                    f.truncate()
+        Returns None if the workfile doesn't exist or can't be parsed.
+        """
+        workfile_path = self.get_workfile_path(folder_path)
+        if workfile_path in self._workfile_cache:
+            return self._workfile_cache[workfile_path]
 
-            except FileNotFoundError:
-                print(f"Error: Workfile not found at {workfile_path}.")
-            except json.JSONDecodeError:
+        try:
+            with open(workfile_path, 'r', encoding='utf-8') as f:
+                image_tags = json.load(f)["image_tags"]
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, KeyError):
+            print(f"  Error reading workfile. Falling back to .txt or empty.")
+            return None
+
+        self._workfile_cache[workfile_path] = image_tags
+        return image_tags
+
+    def invalidate_workfile_cache(self, folder_path):
+        """Drops the cached workfile data for folder_path. Call after writing the workfile outside update_workfile."""
+        workfile_path = self.get_workfile_path(folder_path)
+        self._workfile_cache.pop(workfile_path, None)
+        self._dirty_workfile_paths.discard(workfile_path) # Whoever wrote the file last owns its contents now
+
+    def set_image_tags(self, last_folder_path, image_path, tags):
+        """Records the tags for the given image in the cached workfile without writing it.
+
+        The workfile is written by the next flush_workfiles call, so several quick changes cost one write.
+
+        Returns:
+            bool: True if the workfile changed and needs a flush. False if the image already had exactly these
+                tags (e.g. just navigating to it), or the workfile is missing or corrupted
+        """
+        if not last_folder_path:  # Only save if a folder has been loaded.
+            return False
+        workfile_path = self.get_workfile_path(last_folder_path)
+
+        # The cached image_tags mirror the workfile, so only the write touches the disk
+        image_tags = self._get_cached_image_tags(last_folder_path)
+        if image_tags is None:
+            if os.path.exists(workfile_path):
                 print(f"Error: Corrupted workfile at {workfile_path}.")
+            else:
+                print(f"Error: Workfile not found at {workfile_path}.")
+            return False
+
+        tag_names = [tag.name for tag in tags]  # Store tag names
+        if image_tags.get(image_path) == tag_names:
+            return False # Unchanged, e.g. navigation re-saving the tags it just loaded
+        image_tags[image_path] = tag_names
+        self._dirty_workfile_paths.add(workfile_path)
+        return True
+
+    @staticmethod
+    def write_workfile(workfile_path, workfile_data):
+        """Writes workfile data as compact JSON, atomically.
+
+        The data goes to a temporary file next to the workfile which then replaces it, so a crash
+        or full disk mid-write leaves the previous workfile intact instead of a truncated one.
+
+        Raises:
+            OSError: If the file can't be written; the existing workfile is left unchanged
+        """
+        temp_path = workfile_path + ".tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(workfile_data, f, separators=(',', ':')) # Compact, the workfile is only read back by json.load
+            os.replace(temp_path, workfile_path)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass # Never created, or already gone
+            raise
+
+    def flush_workfiles(self):
+        """Writes every workfile changed by set_image_tags since the last flush."""
+        failed_paths = []
+        while self._dirty_workfile_paths:
+            workfile_path = self._dirty_workfile_paths.pop()
+            image_tags = self._workfile_cache.get(workfile_path)
+            if image_tags is None:
+                continue # Dropped from the cache since, nothing left to write
+            try:
+                self.write_workfile(workfile_path, {"image_tags": image_tags})
+            except OSError as e:
+                print(f"Error writing workfile {workfile_path}: {e}")
+                failed_paths.append(workfile_path) # The old file is intact, keep the changes and retry on the next flush
+        self._dirty_workfile_paths.update(failed_paths)
+
+    def take_dirty_workfiles(self):
+        """Returns the workfiles changed by set_image_tags since the last flush, and marks them clean.
+
+        Returns:
+            list: (workfile_path, image_tags) tuples. image_tags is a shallow copy, safe to write from another
+                thread; set_image_tags replaces an image's tag list instead of changing it in place
+        """
+        dirty_workfiles = []
+        while self._dirty_workfile_paths:
+            workfile_path = self._dirty_workfile_paths.pop()
+            image_tags = self._workfile_cache.get(workfile_path)
+            if image_tags is not None:
+                dirty_workfiles.append((workfile_path, dict(image_tags)))
+        return dirty_workfiles
+
+    def mark_workfile_dirty(self, workfile_path):
+        """Marks a workfile for writing by the next flush, e.g. after a background write failed."""
+        if workfile_path in self._workfile_cache:
+            self._dirty_workfile_paths.add(workfile_path)
+
+    def update_workfile(self, last_folder_path, image_path, tags):
+        """Updates the workfile with the tags for the given image and writes it right away."""
+        if self.set_image_tags(last_folder_path, image_path, tags):
+            self.flush_workfiles()
     
     def gather_all_tags(self, folder_path):
         """Gathers tag data for all images in the specified folder."""
         all_tags = {}
-        workfile_path = self.get_workfile_path(folder_path)
         image_paths = self.get_sorted_image_files(folder_path)
 
-        try:
-            with open(workfile_path, 'r', encoding='utf-8') as f:
-                workfile_data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            workfile_data = {"image_tags": {}}
-
+        # Navigation already read the workfile into the cache, so export doesn't parse it again
+        image_tags_map = self._get_cached_image_tags(folder_path) or {} # Hoisted out of the per-image loop
         for image_path in image_paths:
-            loaded_tags = []
-
-            if workfile_data:
-                if image_path in workfile_data["image_tags"]:
-                    loaded_tags = workfile_data["image_tags"][image_path]
-                    print(f"  Loaded tags from workfile for {image_path}: {loaded_tags}")
+            loaded_tags = image_tags_map.get(image_path) or []
+            if loaded_tags:
+                logger.debug("  Loaded tags from workfile for %s: %s", image_path, loaded_tags)
 
             if not loaded_tags:
-                tag_file_path_no_ext = os.path.splitext(image_path)[0]
-                tag_file_path_txt = tag_file_path_no_ext + ".txt"
-                tag_file_path_ext_txt = image_path + ".txt"
-
-                if os.path.exists(tag_file_path_txt):
-                    tag_file_to_use = tag_file_path_txt
-                elif os.path.exists(tag_file_path_ext_txt):
-                    tag_file_to_use = tag_file_path_ext_txt
-                else:
-                    tag_file_to_use = None
+                # get_sorted_image_files just collected the folder's .txt names, so this doesn't stat
+                tag_file_to_use = self._find_tag_file(image_path)
 
                 if tag_file_to_use:
-                    print(f"  Loading tags from .txt for {image_path}")
+                    logger.debug("  Loading tags from .txt for %s", image_path)
                     try:
                         with open(tag_file_to_use, 'r', encoding='utf-8') as tag_file:
                             tag_content = tag_file.readline().strip()
@@ -132,71 +397,141 @@ class FileOperations:
 
         return all_tags
 
+    @staticmethod
+    def _folder_key(folder_path):
+        """Normalizes a folder path for use as a cache key (case-insensitive on Windows)."""
+        return os.path.normcase(os.path.normpath(folder_path))
+
+    def _find_tag_file(self, image_path):
+        """Returns the path of the .txt tag file for an image, or None.
+
+        Prefers "name.txt" over "name.ext.txt". Uses the .txt names collected by the last
+        scan of the image's folder; folders that haven't been scanned fall back to stat calls.
+        """
+        sidecar_names = self._sidecar_names_by_folder.get(self._folder_key(os.path.dirname(image_path)))
+        return find_sidecar_file(image_path, sidecar_names)
+
+    @staticmethod
+    def _read_tag_file(tag_file_path):
+        """Reads the comma separated tags from the first line of a .txt tag file, with spaces converted to underscores."""
+        with open(tag_file_path, 'r', encoding='utf-8') as tag_file:
+            tag_content = tag_file.readline().strip()
+        return [FileOperations.convert_spaces_to_underscores(tag.strip()) for tag in tag_content.split(',')]
+
+    def get_workfile_image_paths(self, folder_path):
+        """Returns the images the folder's workfile has tags for, as a frozenset (empty if there's no workfile)."""
+        return frozenset(self._get_cached_image_tags(folder_path) or ())
+
+    def set_preloaded_sidecar_tags(self, folder_path, sidecar_tags_by_image):
+        """Keeps the .txt tags read at folder load (read_sidecar_tags), for the images without a workfile entry.
+
+        Navigating to those images is then an in-memory lookup instead of a file read.
+        """
+        image_tags = self._get_cached_image_tags(folder_path) or {}
+        # The workfile takes priority, and may have gained entries while the tag files were read
+        self._sidecar_tags_by_image = {image_path: preloaded for image_path, preloaded in sidecar_tags_by_image.items()
+                                       if image_path not in image_tags}
+        logger.debug("Preloaded tags from %s .txt files in %s", len(self._sidecar_tags_by_image), folder_path)
+
+    def _scan_image_folder(self, folder_path):
+        """Lists a folder's images and .txt tag files, reusing the last scan while the folder is unchanged.
+
+        Export (gather_all_tags) and bulk operations (ensure_workfile_complete) scan the folder that was
+        already scanned at load, so the last scan is reused while the folder's modification time is unchanged.
+        Adding, removing or renaming files updates that time.
+
+        Returns:
+            tuple: (naturally sorted image paths, set of normcased .txt filenames)
+
+        Raises:
+            FileNotFoundError: If the folder doesn't exist
+        """
+        if self._last_folder_scan is not None:
+            scanned_folder_key, scanned_mtime, image_paths, sidecar_names = self._last_folder_scan
+            if scanned_folder_key == self._folder_key(folder_path) and scanned_mtime == os.stat(folder_path).st_mtime_ns:
+                return image_paths, sidecar_names
+
+        scan_result = scan_image_folder(folder_path)
+        self.add_folder_scan(folder_path, scan_result)
+        return scan_result[1], scan_result[2]
+
+    def add_folder_scan(self, folder_path, scan_result):
+        """Stores a scan_image_folder result, e.g. from a FolderScanWorker, as the folder's last scan."""
+        folder_mtime, image_paths, sidecar_names = scan_result
+        self._last_folder_scan = (self._folder_key(folder_path), folder_mtime, image_paths, sidecar_names)
+
+    def invalidate_folder_scan(self, folder_path):
+        """Drops the .txt names and preloaded tags gathered for folder_path, e.g. after its contents changed on disk."""
+        folder_key = self._folder_key(folder_path)
+        self._sidecar_names_by_folder.pop(folder_key, None)
+        if self._last_folder_scan is not None and self._last_folder_scan[0] == folder_key:
+            self._last_folder_scan = None # Files may have been rewritten without changing the folder's mtime
+        self._sidecar_tags_by_image = {}
+
+    @staticmethod
+    def _is_sidecar_unchanged(tag_file_path, tag_file_version):
+        """Returns True if a tag file still has the (mtime_ns, size) read_sidecar_tags recorded for it."""
+        try:
+            tag_file_stat = os.stat(tag_file_path)
+        except OSError:
+            return False # Deleted or renamed, let the normal lookup decide
+        return (tag_file_stat.st_mtime_ns, tag_file_stat.st_size) == tag_file_version
+
     def load_tags_for_image(self, image_path, last_folder_path):
         """Loads tags for a single image, prioritizing workfile then .txt file."""
         loaded_tags_from_workfile = False
-        workfile_path = self.get_workfile_path(last_folder_path)
 
         loaded_tags = [] # Initialize here
 
-        if os.path.exists(workfile_path):
-            try:
-                with open(workfile_path, 'r', encoding='utf-8') as f:
-                    workfile_data = json.load(f)
-                    image_key = image_path
-                    if image_key in workfile_data["image_tags"]:
-                        loaded_tags = workfile_data["image_tags"][image_key]
-                        print(f"  Loaded tags from workfile: {loaded_tags}")
-                        loaded_tags_from_workfile = True
-            except FileNotFoundError:
-                print(f"  Workfile not found (though existence was just checked).")
-            except json.JSONDecodeError:
-                print(f"  Error reading workfile. Falling back to .txt or empty.")
-
-        if not loaded_tags_from_workfile:
-            tag_file_path_no_ext = os.path.splitext(image_path)[0]
-            tag_file_path_txt = tag_file_path_no_ext + ".txt"
-            tag_file_path_ext_txt = image_path + ".txt"
-
-
-            if os.path.exists(tag_file_path_txt):
-                tag_file_to_use = tag_file_path_txt
-            elif os.path.exists(tag_file_path_ext_txt):
-                tag_file_to_use = tag_file_path_ext_txt
-            else:
-                tag_file_to_use = None
+        image_tags = self._get_cached_image_tags(last_folder_path)
+        if image_tags is not None and image_path in image_tags:
+            loaded_tags = list(image_tags[image_path]) # Copy so callers can't mutate the cached entry
+            logger.debug("  Loaded tags from workfile: %s", loaded_tags)
+            loaded_tags_from_workfile = True
+
+        # Read at folder load; once the tags are in the workfile this copy isn't needed anymore
+        preloaded_sidecar = None if loaded_tags_from_workfile else self._sidecar_tags_by_image.pop(image_path, None)
+        if preloaded_sidecar is not None and not self._is_sidecar_unchanged(preloaded_sidecar[0], preloaded_sidecar[1]):
+            # Edited in place since the folder load; the folder watcher doesn't report that, so read it again below
+            logger.debug("  Preloaded tags outdated, %s changed on disk", preloaded_sidecar[0])
+            preloaded_sidecar = None
+
+        if preloaded_sidecar is not None:
+            loaded_tags = preloaded_sidecar[2]
+            logger.debug("  Loaded preloaded tags from .txt file: %s", loaded_tags)
+        elif not loaded_tags_from_workfile:
+            tag_file_to_use = self._find_tag_file(image_path)
 
             if tag_file_to_use:
-                print(f"  Loading tags from: {tag_file_to_use}")
+                logger.debug("  Loading tags from: %s", tag_file_to_use)
                 try:
-                    with open(tag_file_to_use, 'r', encoding='utf-8') as tag_file:
-                        tag_content = tag_file.readline().strip()
-                        loaded_tags = [tag.strip() for tag in tag_content.split(',')]
-                        
-                        # txt files may have spaces in tag names, so convert them to underscores before loading to workfile or model
-                        for i in range(len(loaded_tags)):
-                            loaded_tags[i] = FileOperations.convert_spaces_to_underscores(loaded_tags[i])
-                        print(f"  Loaded tags from .txt file: {loaded_tags}")
-                
+                    # txt files may have spaces in tag names, _read_tag_file converts them to underscores before loading to workfile or model
+                    loaded_tags = self._read_tag_file(tag_file_to_use)
+                    logger.debug("  Loaded tags from .txt file: %s", loaded_tags)
                 except Exception as e:
                     print(f"  Error reading tag file: {e}")
                     loaded_tags = [] # Ensure loaded_tags is empty on error.
             else:
-                print("  No tag file found for this image.")
+                logger.debug("  No tag file found for this image.")
                 loaded_tags = [] # Ensure loaded_tags is empty if no file is found.
         return loaded_tags
 
 
-    def export_tags(self, parent, last_folder_path):
-        """Handles the export process: prompts for export directory, gathers tags, and writes files."""
-        from PySide6.QtWidgets import QFileDialog
+    def export_tags(self, parent, last_folder_path, skip_empty=False):
+        """Handles the export process: prompts for export directory, gathers tags, and writes files.
+
+        Args:
+            parent: Parent widget for the dialogs
+            last_folder_path (str): The image folder whose tags are exported
+            skip_empty (bool): Don't write a .txt file for images without tags
+        """
+        from PySide6.QtWidgets import QFileDialog, QMessageBox
         import sys
         import subprocess
 
         # Create the 'output' directory if it doesn't exist
-        output_dir = os.path.join(os.getcwd(), "output")
-        if not os.path.isdir(output_dir):
-            os.makedirs(output_dir, exist_ok=True)
+        output_dir = OUTPUT_DIR
+        os.makedirs(output_dir, exist_ok=True)
 
         # Use the currently loaded folder as the starting point of the Dialogif available, otherwise fall back to the output directory
         starting_dir = last_folder_path if last_folder_path and os.path.isdir(last_folder_path) else output_dir
@@ -207,23 +542,51 @@ class FileOperations:
         if export_dir:  # Proceed only if the user selected a directory.
             export_dir = os.path.normpath(export_dir)
             print(f"Exporting tags to: {export_dir}")
+            # Export may add .txt files there
+            export_folder_key = self._folder_key(export_dir)
+            self._sidecar_names_by_folder.pop(export_folder_key, None)
+            if self._last_folder_scan is not None and self._last_folder_scan[0] == export_folder_key:
+                self._last_folder_scan = None
 
             all_tags = self.gather_all_tags(last_folder_path) #we assume if they are exporting, that they have opened a dir
 
+            separator = ", "
+            convert_tag = FileOperations.convert_underscores_to_spaces # TODO: may need to have it configurable
+            written_count = 0
+            skipped_count = 0
+            errors = [] # (filename, error) pairs, reported together once the export is done
             for image_path, tags in all_tags.items():
+                if not tags and skip_empty:
+                    skipped_count += 1
+                    continue
+
                 filename = os.path.basename(image_path)
-                base_filename, _ = os.path.splitext(filename)  # Remove extension
-                txt_filename = base_filename + ".txt"
-                txt_filepath = os.path.join(export_dir, txt_filename)
+                base_filename = filename.rpartition('.')[0]  # Remove extension, image filenames always have one
+                txt_filepath = os.path.join(export_dir, base_filename + ".txt")
 
+                # Build the whole file up front so it goes out in a single write
+                file_content = separator.join([convert_tag(tag) for tag in tags])
                 try:
                     with open(txt_filepath, 'w', encoding='utf-8') as f:
-                        spaced_tags = [FileOperations.convert_underscores_to_spaces(tag) for tag in tags] # TODO: may need to have it configurable
-                        f.write(", ".join(spaced_tags))
-                    print(f"  Wrote tags for {filename} to {txt_filepath}")
+                        f.write(file_content)
+                    written_count += 1
                 except Exception as e:
-                    print(f"  Error writing to {txt_filepath}: {e}")
-                    # Consider showing an error message to the user (QMessageBox).
+                    errors.append((filename, e))
+
+            print(f"  Wrote {written_count} tag files, skipped {skipped_count} images without tags, {len(errors)} errors.")
+            if errors:
+                for filename, e in errors:
+                    print(f"  Error writing tags for {filename}: {e}")
+                # One dialog for the whole export instead of one per failed file
+                error_lines = "\n".join(f"{filename}: {e}" for filename, e in errors[:10])
+                if len(errors) > 10:
+                    error_lines += f"\n...and {len(errors) - 10} more"
+                QMessageBox.warning(
+                    parent,
+                    "Export Errors",
+                    f"Could not write tags for {len(errors)} of {len(errors) + written_count} images:\n\n{error_lines}",
+                    QMessageBox.Ok
+                )
 
             # Open the export directory in the file explorer.
             if sys.platform == 'win32':
@@ -241,7 +604,8 @@ class FileOperations:
         if not os.path.exists(workfile_path):
             try:
                 with open(workfile_path, 'w', encoding='utf-8') as f:
-                    json.dump({"image_tags": {}}, f)
+                    f.write('{"image_tags":{}}') # Fixed content, no need to serialize anything
+                self._workfile_cache[workfile_path] = {} # Known to be empty, so the first image load doesn't read it back
                 print(f"Created default workfile at {workfile_path}")
             except Exception as e:
                 print(f"Error creating default workfile: {e}")
@@ -262,13 +626,14 @@ class FileOperations:
         """
         workfile_path = self.get_workfile_path(folder_path)
 
-        # Load existing workfile or create default structure
-        try:
-            with open(workfile_path, 'r', encoding='utf-8') as f:
-                workfile_data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+        # Start from the cached workfile, usually already read while navigating, or create default structure
+        image_tags = self._get_cached_image_tags(folder_path)
+        if image_tags is None:
             workfile_data = {"image_tags": {}}
             print(f"Creating new workfile structure for {folder_path}")
+        else:
+            # Copy the tag lists, callers edit them in place and the cache must keep matching the file until they save
+            workfile_data = {"image_tags": {image_path: list(tags) for image_path, tags in image_tags.items()}}
 
         # Get all image files in folder
         image_paths = self.get_sorted_image_files(folder_path)
@@ -290,27 +655,14 @@ class FileOperations:
             if image_path in workfile_data["image_tags"]:
                 continue
 
-            # Load tags from .txt file or default to empty
-            tag_file_path_no_ext = os.path.splitext(image_path)[0]
-            tag_file_path_txt = tag_file_path_no_ext + ".txt"
-            tag_file_path_ext_txt = image_path + ".txt"
-
+            # Load tags from .txt file or default to empty. The scan above collected the folder's .txt names, so this doesn't stat
             loaded_tags = []
-
-            if os.path.exists(tag_file_path_txt):
-                tag_file_to_use = tag_file_path_txt
-            elif os.path.exists(tag_file_path_ext_txt):
-                tag_file_to_use = tag_file_path_ext_txt
-            else:
-                tag_file_to_use = None
+            tag_file_to_use = self._find_tag_file(image_path)
 
             if tag_file_to_use:
                 try:
-                    with open(tag_file_to_use, 'r', encoding='utf-8') as tag_file:
-                        tag_content = tag_file.readline().strip()
-                        loaded_tags = [tag.strip() for tag in tag_content.split(',')]
-                        # Convert spaces to underscores for consistency
-                        loaded_tags = [FileOperations.convert_spaces_to_underscores(tag) for tag in loaded_tags]
+                    # Converts spaces to underscores for consistency
+                    loaded_tags = self._read_tag_file(tag_file_to_use)
                 except Exception as e:
                     print(f"Error reading tag file {tag_file_to_use}: {e}")
                     loaded_tags = []
@@ -322,8 +674,8 @@ class FileOperations:
         # Save workfile if we made any changes
         if initialized_count > 0:
             try:
-                with open(workfile_path, 'w', encoding='utf-8') as f:
-                    json.dump(workfile_data, f, indent=2)
+                self.write_workfile(workfile_path, workfile_data)
+                self.invalidate_workfile_cache(folder_path)
                 print(f"Initialized {initialized_count} new entries in workfile")
             except Exception as e:
                 print(f"Error saving workfile: {e}")
@@ -333,7 +685,7 @@ class FileOperations:
 
     def load_favorites(self):
         """Loads the ordered list of favorite tag names from favorites.json."""
-        favorites_file_path = os.path.join(os.getcwd(), "data", "favorites.json")
+        favorites_file_path = FAVORITES_PATH
         data = self._load_json_file(
             favorites_file_path, 
             default_value={"favorites": []},
@@ -343,7 +695,7 @@ class FileOperations:
         
     def save_favorites(self, favorite_tags):
         """Saves the ordered list of favorite tag names to favorites.json."""
-        favorites_file_path = os.path.join(os.getcwd(), "data", "favorites.json")
+        favorites_file_path = FAVORITES_PATH
         tag_names = [tag.name for tag in favorite_tags] # Extract names!
         self._save_json_file(favorites_file_path, {"favorites": tag_names})
 
@@ -395,7 +747,7 @@ class FileOperations:
         Returns a dictionary of tag names to usage counts.
         Returns an empty dict if file not found or loading fails.
         """
-        usage_data_path = os.path.join(os.getcwd(), "data", "usage_data.json")
+        usage_data_path = USAGE_DATA_PATH
         data = self._load_json_file(
             usage_data_path, 
             default_value={},
@@ -406,29 +758,23 @@ class FileOperations:
     
     def save_usage_data(self, usage_data):
         """Saves tag usage data to usage_data.json."""
-        usage_data_path = os.path.join(os.getcwd(), "data", "usage_data.json")
+        usage_data_path = USAGE_DATA_PATH
         success = self._save_json_file(usage_data_path, usage_data)
         if success:
-            print(f"  Saved usage data to: {usage_data_path}")
+            logger.debug("  Saved usage data to: %s", usage_data_path)
         return success
 
     # This method is now handled by _load_json_file with create_if_missing=True
     def create_default_usage_data(self):
         """Creates a default usage data file if it doesn't exist."""
-        usage_data_path = os.path.join(os.getcwd(), "data", "usage_data.json")
+        usage_data_path = USAGE_DATA_PATH
         return self._save_json_file(usage_data_path, {})
 
     def get_sorted_image_files(self, folder_path):
         """Gets a naturally sorted list of image file paths from a directory."""
-        import re
-
-        def natural_sort_key(s):
-            return [int(text) if text.isdigit() else text.lower() for text in re.split('([0-9]+)', s)]
-
-        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.bmp']
         try:
-            filenames = [f for f in os.listdir(folder_path) if any(f.lower().endswith(ext) for ext in image_extensions)]
-            filenames.sort(key=natural_sort_key)
-            return [os.path.join(folder_path, f) for f in filenames]
+            image_paths, sidecar_names = self._scan_image_folder(folder_path)
+            self._sidecar_names_by_folder[self._folder_key(folder_path)] = sidecar_names
+            return list(image_paths) # Copy, the cached scan must not change with the caller's list
         except FileNotFoundError:
             return []
\ No newline at end of file
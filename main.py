@@ -1,5 +1,6 @@
 import sys
 import os
+import logging
 
 def check_dependencies():
     """Verify critical dependencies can be imported."""
@@ -35,13 +36,17 @@ def check_dependencies():
 # Check dependencies before importing heavy modules
 check_dependencies()
 
+# Debug output from the click/navigation paths goes through logging so it costs nothing unless enabled
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
+
 import time
 import theme
-from file_operations import FileOperations
+from file_operations import FileOperations, FolderScanWorker, WorkfileWriteWorker, DATA_DIR, STAGING_DIR
 from config_manager import ConfigManager
 from keyboard_manager import KeyboardManager
 from classifier_manager import ClassifierManager
-from tag_list_model import TagListModel, TagData
+from tag_list_model import TagListModel, TagData, TagCsvLoadWorker
 from tail_tagger.bulk_operations import BulkOperationsManager, TagBulkOperationDialog
 
 from left_panel_container import LeftPanelContainer
@@ -53,7 +58,7 @@ app_start_time = time.time()
 import resources.resources_rc as resources_rc  
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QHBoxLayout, QFrame, QLabel, QSizePolicy, 
                                QVBoxLayout, QPushButton, QSpacerItem, QFileDialog, QSplitter, QMessageBox)
-from PySide6.QtCore import Qt, QTimer, Slot, QUrl
+from PySide6.QtCore import Qt, QTimer, Slot, QUrl, QThreadPool, QFileSystemWatcher
 from PySide6.QtGui import QKeySequence, QShortcut, QIcon, QDesktopServices
 
 # TODO: its probably better for tag widget shading to not need every panel to rebuild their tag list and instead just 
@@ -75,9 +80,11 @@ class MainWindow(QMainWindow):
 
         # --- Instance Variables ---
         self.image_paths = []  # List of image file paths for the loaded folder.
+        self.image_count_text = "0"  # str(len(self.image_paths)), cached for the index label
         self.current_image_index = 0
         self.current_image_path = None
         self.last_folder_path = None
+        self._pending_folder_scan_path = None  # Folder whose background scan _load_image_folder is waiting on
         
         # --- Tag Management ---
         """These lists are used by panels that need to display tags in a particular order.
@@ -108,6 +115,31 @@ class MainWindow(QMainWindow):
         self.AUTO_ANALYZE_DELAY_MS = 1500 # 1.5 seconds (configurable if needed later)
         self.auto_analyze_enabled = False
 
+        # --- Workfile Flush Timer ---
+        # Tag changes go to the cached workfile right away; the file itself is written once they stop for a moment,
+        # so toggling several tags in a row costs one write instead of one per click
+        self.workfile_flush_timer = QTimer(self)
+        self.workfile_flush_timer.setSingleShot(True)
+        self.workfile_flush_timer.setInterval(200)
+        self.workfile_flush_timer.timeout.connect(self._write_workfile_in_background)
+        # Timed flushes are written on this pool. A single thread runs the writes in the order they were queued,
+        # so an older snapshot never overwrites a newer one
+        self.workfile_write_pool = QThreadPool(self)
+        self.workfile_write_pool.setMaxThreadCount(1)
+
+        # --- Navigation Load Timer ---
+        # Holding an arrow key fires Next/Prev faster than images can be loaded. The index label follows every step,
+        # but the image and its tags are only loaded once the steps pause, for the index they ended on
+        self.navigation_load_timer = QTimer(self)
+        self.navigation_load_timer.setSingleShot(True)
+        self.navigation_load_timer.setInterval(30)
+        self.navigation_load_timer.timeout.connect(self._load_current_index_image)
+
+        # --- Folder Watcher ---
+        # Tag files read at folder load go stale if the folder changes on disk, so drop them when it does
+        self.folder_watcher = QFileSystemWatcher(self)
+        self.folder_watcher.directoryChanged.connect(self._on_watched_folder_changed)
+
         # --- Global Keyboard Shortcuts ---
         self.prev_shortcut = QShortcut(QKeySequence(Qt.Key_Left), self)
         self.prev_shortcut.activated.connect(self._prev_image)
@@ -118,39 +150,66 @@ class MainWindow(QMainWindow):
         self.next_shortcut.activated.connect(self._next_image)
        
         # --- Staging Folder ---
-        self.staging_folder_path = os.path.join(os.getcwd(), "staging")
-        if not os.path.isdir(self.staging_folder_path):
-            os.makedirs(self.staging_folder_path, exist_ok=True)
+        self.staging_folder_path = STAGING_DIR
+        os.makedirs(self.staging_folder_path, exist_ok=True) # Already handles an existing folder, no isdir check needed
         self.file_operations.staging_folder_path = self.staging_folder_path
 
+        # --- Setup UI ---
+        self._setup_ui()
+
         # --- Load Tags from CSV ---
-        csv_load_start = time.time()
-        self.csv_path = os.path.join(os.getcwd(), "data", f"{self.current_tag_source}-tags-list.csv")
-        self.tag_list_model.load_tags_from_csv(self.csv_path)
-        csv_load_end = time.time()
-        print(f"CSV loading complete in {csv_load_end - csv_load_start:.4f} seconds")
+        # Parsed on the thread pool so the window paints right away. Favorites and the
+        # last opened folder need the tag model, so they are loaded once the tags arrive.
+        self.csv_path = os.path.join(DATA_DIR, f"{self.current_tag_source}-tags-list.csv")
+        self._start_tag_loading()
+
+    def _start_tag_loading(self):
+        """Starts parsing the tag CSV in the background. Opening a folder waits until the tags are in the model."""
+        self.csv_load_start_time = time.time()
+        self.open_folder_action.setEnabled(False)
+        # Switching the source reloads the model synchronously, which the worker's tags would then be added on top of
+        self.left_panel_container.tag_search_panel.tag_source_toggle_button.setEnabled(False)
+        worker = TagCsvLoadWorker(self.csv_path)
+        worker.signals.loaded.connect(self._on_tags_loaded)
+        QThreadPool.globalInstance().start(worker)
+
+    @Slot(str, object)
+    def _on_tags_loaded(self, csv_path, tag_data_list):
+        """Adds the parsed tags to the model, then loads favorites and the last opened folder."""
+        requested_csv_path = os.path.join(DATA_DIR, f"{self.current_tag_source}-tags-list.csv")
+        if csv_path != requested_csv_path:
+            # The source was switched while this CSV was parsed, and switch_tag_source already loaded the new one.
+            # Only the tags are outdated, the rest of the startup below still has to run
+            print(f"Ignoring tags from {csv_path}, the tag source was switched while it loaded")
+        else:
+            self.tag_list_model.add_loaded_tags(tag_data_list)
+            print(f"CSV loading complete in {time.time() - self.csv_load_start_time:.4f} seconds")
 
         # --- Load Favorites After Tag Model is Ready ---
         self._load_favorites()
+        self._update_tag_panels()
+        self.open_folder_action.setEnabled(True)
+        self.left_panel_container.tag_search_panel.tag_source_toggle_button.setEnabled(True)
 
-        # --- Tag Panels ---
-        self.selected_tags_panel = SelectedTagsPanel(self)
+        # --- Load Last Opened Folder ---
+        self._load_initial_directory()
 
-        # --- Setup UI and Load Tags/Images ---
-        self._setup_ui()
+    def _load_initial_directory(self):
+        """Loads the last opened folder from config, if one is remembered and still exists."""
+        if not self.last_folder_path:
+            print("No valid last opened folder. Select a folder from the file menu.")
+            self._load_image_folder(None)
+            return
 
-        # --- Validate and Load Last Opened Folder ---
-        if self.last_folder_path and not os.path.isdir(self.last_folder_path):
+        if not os.path.isdir(self.last_folder_path):
             print(f"Last opened folder not found: {self.last_folder_path}. Clearing from config.")
             self.last_folder_path = None
             self.config_manager.set_config_value("last_opened_folder", None)
-
-        if (self.last_folder_path):
-            print(f"Loading last opened folder: {self.last_folder_path}")
-            self._load_image_folder(self.last_folder_path)
-        else:
-            print("No valid last opened folder. Select a folder from the file menu.")
             self._load_image_folder(None)
+            return
+
+        print(f"Loading last opened folder: {self.last_folder_path}")
+        self._load_image_folder(self.last_folder_path)
 
     def _setup_ui(self):
         """Sets up the main user interface layout and elements."""
@@ -160,8 +219,8 @@ class MainWindow(QMainWindow):
         # --- Menu Bar ---
         menu_bar = self.menuBar()
         file_menu = menu_bar.addMenu("&File")
-        open_folder_action = file_menu.addAction("Open Folder...")
-        open_folder_action.triggered.connect(self._open_folder_dialog)
+        self.open_folder_action = file_menu.addAction("Open Folder...")
+        self.open_folder_action.triggered.connect(self._open_folder_dialog)
 
         export_action = file_menu.addAction("Export Tags...")
         export_action.triggered.connect(self._export_tags)
@@ -191,6 +250,7 @@ class MainWindow(QMainWindow):
         main_splitter.addWidget(self.center_panel)  # Add to splitter
 
         # --- Right Panel (Selected Tags) ---
+        self.selected_tags_panel = SelectedTagsPanel(self)
         main_splitter.addWidget(self.selected_tags_panel)  # Add panel directly to splitter
 
         # Set initial sizes for the splitter. Essentially left and right will be fixed width between this and the set stretch factors
@@ -271,6 +331,10 @@ class MainWindow(QMainWindow):
 
     def _load_image_folder(self, folder_path):
         """Loads images from the given folder and updates the UI."""
+        self._flush_workfile() # Pending changes belong to the previous folder's workfile
+        self._pending_folder_scan_path = None # A scan still running for another folder is outdated now
+        self.navigation_load_timer.stop() # Its index refers to the previous folder
+        self._watch_folder(folder_path)
         if not folder_path:
             print("No folder path, handling as no images.")
             self.image_paths = []
@@ -287,8 +351,37 @@ class MainWindow(QMainWindow):
         
         # Update folder path label with elided text
         self._update_folder_path_label(folder_path)
-        
-        self.image_paths = self.file_operations.get_sorted_image_files(folder_path)
+
+        # The previous folder's images are gone; nothing is shown or tagged until the scan comes back
+        self.image_paths = []
+        self.current_image_path = None
+        self.center_panel.set_image_path(None)
+        self.center_panel.setText("Loading folder...")
+        self.filename_label.setText("No Image")
+        self.index_label.setText("0 of 0")
+        self.prev_button.setEnabled(False)
+        self.next_button.setEnabled(False)
+
+        # Listing a large folder can take a while, scan it on the thread pool so the window stays responsive
+        self._pending_folder_scan_path = folder_path
+        worker = FolderScanWorker(folder_path, self.file_operations.get_workfile_image_paths(folder_path))
+        worker.signals.scanned.connect(self._on_folder_scanned)
+        QThreadPool.globalInstance().start(worker)
+
+    @Slot(str, object, object)
+    def _on_folder_scanned(self, folder_path, scan_result, sidecar_tags_by_image):
+        """Shows the first image of a folder once its background scan is done."""
+        if folder_path != self._pending_folder_scan_path:
+            logger.debug("Ignoring outdated scan of %s", folder_path)
+            return # Another folder was opened while this one was being scanned
+        self._pending_folder_scan_path = None
+
+        if scan_result is not None:
+            self.file_operations.add_folder_scan(folder_path, scan_result)
+        self.image_paths = self.file_operations.get_sorted_image_files(folder_path) # Served from the scan just stored
+        self.image_count_text = str(len(self.image_paths))
+        # Read by the scan worker, so navigation doesn't open .txt files and this doesn't either
+        self.file_operations.set_preloaded_sidecar_tags(folder_path, sidecar_tags_by_image or {})
 
         if self.image_paths:
             print(f"Found {len(self.image_paths)} images in folder: {folder_path}")
@@ -306,8 +399,29 @@ class MainWindow(QMainWindow):
             self.prev_button.setEnabled(False)
             self.next_button.setEnabled(False)
 
-    def _load_and_display_image(self, image_path):
-        """Loads and displays an image, loads associated tags."""
+    def _watch_folder(self, folder_path):
+        """Watches folder_path (or nothing, if None) for changes to its files."""
+        watched_folders = self.folder_watcher.directories()
+        if watched_folders:
+            self.folder_watcher.removePaths(watched_folders)
+        if folder_path:
+            self.folder_watcher.addPath(folder_path)
+
+    @Slot(str)
+    def _on_watched_folder_changed(self, folder_path):
+        """Drops the .txt names and tags read at folder load, tag files are then read from disk again."""
+        logger.debug("Folder changed on disk: %s", folder_path)
+        self.file_operations.invalidate_folder_scan(folder_path)
+
+    def _load_and_display_image(self, image_path, force_reload=False):
+        """Loads and displays an image, loads associated tags.
+
+        Args:
+            image_path (str): Image to show
+            force_reload (bool): Reload even if image_path is already shown, e.g. after its tags changed on disk
+        """
+        if image_path == self.current_image_path and not force_reload:
+            return # Already showing it with its tags, e.g. Next/Prev in a single-image folder
 
         self.center_panel.set_image_path(image_path)
         filename = os.path.basename(image_path)
@@ -319,7 +433,7 @@ class MainWindow(QMainWindow):
 
         # Use our internal state variable instead of walking the widget tree
         if self.auto_analyze_enabled:
-            print("Auto-analyze is enabled. Resetting/starting timer.")
+            logger.debug("Auto-analyze is enabled. Resetting/starting timer.")
             self.auto_analyze_timer.stop() # Stop any pending timer
             self.auto_analyze_timer.start(self.AUTO_ANALYZE_DELAY_MS) # Start new delay
         else:
@@ -328,36 +442,58 @@ class MainWindow(QMainWindow):
 
         # --- Load Tags for Image ---
         loaded_tag_names = self.file_operations.load_tags_for_image(image_path, self.last_folder_path) # Get list of tag *names*
-        self.selected_tags_for_current_image = []  # Clear the list of selected tag widgets
-        self.tag_list_model.clear_selected_tags() # Clear selections attrs in model
-        self.tag_list_model.remove_unknown_tags() # Remove any unknown tags
-        # Process tag names against current model to get proper TagData objects
-        self.selected_tags_for_current_image = self._process_tag_names_for_selection(loaded_tag_names)
-
-        self.update_workfile_for_current_image() # Update workfile with current tags
-
-        # Now that we've updated the model, all panels must be populated with the appropriate tags
-        self._update_tag_panels()
+        loaded_tag_set = set(loaded_tag_names)
+
+        # Hold repaints until every panel has its new state, so the switch is painted once
+        central_widget = self.centralWidget()
+        central_widget.setUpdatesEnabled(False)
+        self.tag_list_model.begin_batch() # Listeners get one tags_selected_changed for the whole switch, not one per tag
+        try:
+            self.selected_tags_for_current_image = []  # Clear the list of selected tag widgets
+            # Clear selections attrs in model. Tags the new image also has stay selected, so only tags whose state changes are restyled
+            self.tag_list_model.clear_selected_tags(keep_tag_names=loaded_tag_set)
+            self.tag_list_model.remove_unknown_tags(keep_tag_names=loaded_tag_set) # Remove unknown tags the new image doesn't have
+            # Process tag names against current model to get proper TagData objects
+            self.selected_tags_for_current_image = self._process_tag_names_for_selection(loaded_tag_names)
+
+            self.update_workfile_for_current_image() # Update workfile with current tags
+
+            # Only the selected panel's list depends on the image. Favorites and frequent tags don't change when
+            # navigating (frequent only lists known tags), and their widgets restyle themselves through the observers
+            self.selected_tags_panel.update_display()
+        finally:
+            self.tag_list_model.end_batch()
+            central_widget.setUpdatesEnabled(True)
 
         # we load the search panel differently than the others (update_display()) because I'm a bad developer
         self.left_panel_container.tag_search_panel._on_tags_changed()  
 
-        # Debugging prints to be deleted later!
-        total_tags = len(self.tag_list_model.tags)
-        selected_tags = len([tag for tag in self.tag_list_model.tags if tag.selected])
-        unknown_tags = len([tag for tag in self.tag_list_model.tags if not tag.is_known])
-        
-        print(f"Total tags in model: {total_tags}")
-        print(f"Selected tags: {selected_tags}")
-        print(f"Unknown tags: {unknown_tags}")
+        self._prefetch_neighbour_images()
+
+        # Debugging counts. The model tracks selected and unknown tags, so none of these walk the tag list
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Tags in model: %s, selected: %s, unknown: %s",
+                         len(self.tag_list_model.tags),
+                         self.tag_list_model.get_selected_tag_count(),
+                         len(self.tag_list_model.get_unknown_tags()))
+
+    def _prefetch_neighbour_images(self):
+        """Starts background decodes of the next and previous images (navigation wraps around)."""
+        image_count = len(self.image_paths)
+        if image_count < 2:
+            return
+        next_path = self.image_paths[(self.current_image_index + 1) % image_count]
+        prev_path = self.image_paths[(self.current_image_index - 1) % image_count]
+        self.center_panel.prefetch_images([next_path, prev_path])
 
     def _update_index_label(self):
         """Updates the image index label."""
         if self.image_paths:
-            index_text = f"{self.current_image_index + 1} of {len(self.image_paths)}"
+            index_text = f"{self.current_image_index + 1} of {self.image_count_text}"
         else:
             index_text = "0 of 0"
-        self.index_label.setText(index_text)
+        if index_text != self.index_label.text(): # Skip the relayout when nothing changed (e.g. single-image folders, reloads)
+            self.index_label.setText(index_text)
 
     def _update_folder_path_label(self, folder_path):
         """Updates the folder path label with elided text."""
@@ -390,9 +526,8 @@ class MainWindow(QMainWindow):
         if self.current_image_index < 0:
             self.current_image_index = len(self.image_paths) - 1
 
-        image_path = self.image_paths[self.current_image_index]
-        self._load_and_display_image(image_path)
         self._update_index_label()
+        self.navigation_load_timer.start() # Restarting coalesces rapid steps into one load
 
     def _next_image(self):
         """Navigates to the next image."""
@@ -403,12 +538,19 @@ class MainWindow(QMainWindow):
         if self.current_image_index >= len(self.image_paths):
             self.current_image_index = 0
 
-        image_path = self.image_paths[self.current_image_index]
-        self._load_and_display_image(image_path)
         self._update_index_label()
+        self.navigation_load_timer.start() # Restarting coalesces rapid steps into one load
+
+    def _load_current_index_image(self):
+        """Loads the image at current_image_index, once navigation has paused."""
+        if not self.image_paths or self.current_image_index >= len(self.image_paths):
+            return # Folder changed or emptied while the load was pending
+        self._load_and_display_image(self.image_paths[self.current_image_index])
 
     def _export_tags(self):
-        self.file_operations.export_tags(self, self.last_folder_path)
+        self._flush_workfile() # Have the workfile on disk match what gets exported
+        skip_empty = bool(self.config_manager.get_config_value("export_skip_empty_tag_files"))
+        self.file_operations.export_tags(self, self.last_folder_path, skip_empty=skip_empty)
 
     # LEGACY: This method is kept for backward compatibility and for full refreshes
     # Modern approach uses observer pattern and targeted panel updates
@@ -433,12 +575,12 @@ class MainWindow(QMainWindow):
         favorite_tag_names = self.file_operations.load_favorites()
         
         # Find matching TagData objects in the current model and mark as favorites
+        tags_by_name = self.tag_list_model.tags_by_name # Name lookups instead of scanning every tag per favorite
         for tag_name in favorite_tag_names:
-            for tag in self.tag_list_model.get_all_tags():
-                if tag.name == tag_name:
-                    tag.favorite = True
-                    self.favorite_tags_ordered.append(tag)
-                    break # Move to next fav tag name
+            tag = tags_by_name.get(tag_name)
+            if tag is not None:
+                tag.favorite = True
+                self.favorite_tags_ordered.append(tag)
                     
         print(f"Loaded {len(self.favorite_tags_ordered)} favorite tags")
 
@@ -446,11 +588,7 @@ class MainWindow(QMainWindow):
         """Handles tag click events, updates model, workfile, and selected tags list."""
 
         # Find the TagData object in the model
-        clicked_tag_data = None
-        for tag in self.tag_list_model.get_all_tags():
-            if tag.name == clicked_tag_name:
-                clicked_tag_data = tag
-                break
+        clicked_tag_data = self.tag_list_model.tags_by_name.get(clicked_tag_name)
 
         if clicked_tag_data:
             # Toggle the selected state in the model
@@ -459,9 +597,9 @@ class MainWindow(QMainWindow):
             # Note: set_tag_selected_state now handles notifying observers and emitting signals
 
             if new_selected_state:
-                # Tag was just selected, add it to selected_tags_for_current_image
-                if clicked_tag_data not in self.selected_tags_for_current_image: # Prevent Duplicates
-                    self.selected_tags_for_current_image.append(clicked_tag_data)
+                # Tag was just selected, add it to selected_tags_for_current_image.
+                # The selected flag mirrors membership in that list, and it was unselected, so it can't be a duplicate
+                self.selected_tags_for_current_image.append(clicked_tag_data)
                 self.tag_list_model.increment_tag_usage(clicked_tag_name)
                 self.file_operations.save_usage_data(self.tag_list_model.tag_usage_counts)
             else:
@@ -483,14 +621,10 @@ class MainWindow(QMainWindow):
 
     def _handle_favorite_star_clicked(self, clicked_tag_name):
         """Handles clicks on the favorite star icon in TagWidget."""
-        print(f"Favorite star clicked for tag: {clicked_tag_name}") # Debug - basic confirmation
+        logger.debug("Favorite star clicked for tag: %s", clicked_tag_name)
 
         # 1. Find the TagData object in the model
-        clicked_tag_data = None
-        for tag in self.tag_list_model.get_all_tags():
-            if tag.name == clicked_tag_name:
-                clicked_tag_data = tag
-                break
+        clicked_tag_data = self.tag_list_model.tags_by_name.get(clicked_tag_name)
 
         if clicked_tag_data:
             # 2. Toggle the 'favorite' attribute in TagData
@@ -499,19 +633,18 @@ class MainWindow(QMainWindow):
 
             # 3. Update favorite_tags_ordered list
             if new_favorite_state:
-                # Tag is now a favorite, add it to the list (append to end)
-                if clicked_tag_data not in self.favorite_tags_ordered: # Prevent duplicates
-                    self.favorite_tags_ordered.append(clicked_tag_data)
-                print(f"Tag '{clicked_tag_name}' added to favorites.") # Debug
+                # Tag is now a favorite, add it to the list (append to end). It wasn't a favorite, so it isn't in the list yet
+                self.favorite_tags_ordered.append(clicked_tag_data)
+                logger.debug("Tag '%s' added to favorites.", clicked_tag_name)
             else:
                 # Tag is no longer a favorite, remove it from the list
                 if clicked_tag_data in self.favorite_tags_ordered:
                     self.favorite_tags_ordered.remove(clicked_tag_data)
-                print(f"Tag '{clicked_tag_name}' removed from favorites.") # Debug
+                logger.debug("Tag '%s' removed from favorites.", clicked_tag_name)
 
             # 4. Save updated favorites to favorites.json
             self.file_operations.save_favorites(self.favorite_tags_ordered)
-            print("favorites.json updated.") # Debug
+            logger.debug("favorites.json updated.")
 
             # 5. Notify observers of state change
             clicked_tag_data.notify_observers()
@@ -519,7 +652,7 @@ class MainWindow(QMainWindow):
 
             # 6. Update only the favorites panel as it needs to rebuild
             self.left_panel_container.favorites_panel.update_display()
-            print("Favorites panel updated to reflect favorite changes.") # Debug
+            logger.debug("Favorites panel updated to reflect favorite changes.")
 
         else:
             print(f"Warning: Favorite star clicked for tag '{clicked_tag_name}', but tag not found in TagListModel.")
@@ -553,10 +686,9 @@ class MainWindow(QMainWindow):
             # Select the tag in the model
             self.tag_list_model.set_tag_selected_state(tag_name, True)
 
-            # Add to selected tags list (append to end)
-            if tag_data not in self.selected_tags_for_current_image:
-                self.selected_tags_for_current_image.append(tag_data)
-                added_count += 1
+            # Add to selected tags list (append to end). Unselected tags are never in the list, so no duplicate check is needed
+            self.selected_tags_for_current_image.append(tag_data)
+            added_count += 1
 
         # Single workfile write operation for all changes
         if added_count > 0:
@@ -570,12 +702,41 @@ class MainWindow(QMainWindow):
             print(f"Bulk add: No new tags added ({skipped_count} tags already selected)")
 
     def update_workfile_for_current_image(self):
-        """Updates the workfile for the current image. Make sure selected_tags_for_current_image is up to date before calling this."""
-        self.file_operations.update_workfile(
+        """Updates the workfile for the current image. Make sure selected_tags_for_current_image is up to date before calling this.
+
+        The change is written to disk by _flush_workfile once the flush timer runs out.
+        """
+        if not self.current_image_path:
+            return # No image shown, e.g. while a folder is being scanned
+        if self.file_operations.set_image_tags(
             self.last_folder_path,
             self.current_image_path,
             self.selected_tags_for_current_image
-        )
+        ):
+            self.workfile_flush_timer.start() # Restarting the timer coalesces quick successive changes
+
+    def _write_workfile_in_background(self):
+        """Queues the pending workfile changes on the workfile write pool, so the GUI thread doesn't wait on the disk."""
+        for workfile_path, image_tags in self.file_operations.take_dirty_workfiles():
+            worker = WorkfileWriteWorker(workfile_path, image_tags)
+            worker.signals.write_failed.connect(self._on_workfile_write_failed)
+            self.workfile_write_pool.start(worker)
+
+    @Slot(str)
+    def _on_workfile_write_failed(self, workfile_path):
+        """Keeps the changes of a failed background write pending, so the next flush retries it."""
+        self.file_operations.mark_workfile_dirty(workfile_path)
+
+    def _flush_workfile(self):
+        """Writes pending workfile changes to disk now. Call before anything reads the workfile file directly."""
+        self.workfile_flush_timer.stop()
+        self.workfile_write_pool.waitForDone() # Let queued background writes land first, they hold older data
+        self.file_operations.flush_workfiles()
+
+    def closeEvent(self, event):
+        """Writes pending workfile changes before the window closes."""
+        self._flush_workfile()
+        super().closeEvent(event)
 
     def execute_bulk_operation(self, operation_type, tag_name):
         """Executes a bulk tag operation across all images in the current folder.
@@ -594,11 +755,7 @@ class MainWindow(QMainWindow):
             return
 
         # Find the tag in the model
-        tag_data = None
-        for tag in self.tag_list_model.get_all_tags():
-            if tag.name == tag_name:
-                tag_data = tag
-                break
+        tag_data = self.tag_list_model.tags_by_name.get(tag_name)
 
         if not tag_data:
             QMessageBox.warning(
@@ -613,10 +770,10 @@ class MainWindow(QMainWindow):
             print(f"Auto-promoting unknown tag '{tag_name}' to known tag for bulk add operation")
             self.add_new_tag_to_model(tag_name)
             # Re-fetch tag_data after promotion
-            for tag in self.tag_list_model.get_all_tags():
-                if tag.name == tag_name:
-                    tag_data = tag
-                    break
+            tag_data = self.tag_list_model.tags_by_name.get(tag_name, tag_data)
+
+        # The bulk operation backs up and rewrites the workfile file, so it must hold every pending change
+        self._flush_workfile()
 
         # Create and show progress dialog
         dialog = TagBulkOperationDialog(self, operation_type, tag_name)
@@ -627,7 +784,7 @@ class MainWindow(QMainWindow):
             print(f"Bulk operation completed successfully. Reloading current image to sync UI.")
             # Reload current image to refresh tag state
             if self.current_image_path:
-                self._load_and_display_image(self.current_image_path)
+                self._load_and_display_image(self.current_image_path, force_reload=True)
 
     def add_new_tag_to_model(self, tag_name):
         """
@@ -639,12 +796,17 @@ class MainWindow(QMainWindow):
         # --- Check for existing tags (prioritize known, then check unknown) ---
         existing_tag_data = None
         existing_unknown_tag_data = None
-        for tag in self.tag_list_model.get_all_tags():
-            if tag.name.lower() == underscored_tag_name.lower():
-                if tag.is_known:
-                    existing_tag_data = tag
-                    break  # Exit loop, known tag found
-                else:
+        tag_name_lower = underscored_tag_name.lower() # Lowercase the new name once, not per compared tag
+        # Known tags are indexed under their lowercase, space separated name, so the case-insensitive match is an index lookup
+        search_key = FileOperations.convert_underscores_to_spaces(tag_name_lower)
+        for tag in self.tag_list_model.search_index.get(search_key, ()):
+            if tag.name.lower() == tag_name_lower:
+                existing_tag_data = tag
+                break  # Known tag found
+        if not existing_tag_data:
+            # Unknown tags aren't indexed, check them directly. The model tracks them, so this doesn't walk every tag
+            for tag in self.tag_list_model.get_unknown_tags():
+                if tag.name.lower() == tag_name_lower:
                     existing_unknown_tag_data = tag # Found existing UNKNOWN tag, keep track of it
 
         if existing_tag_data:
@@ -663,6 +825,7 @@ class MainWindow(QMainWindow):
             existing_unknown_tag_data.is_known = True
             existing_unknown_tag_data.category = "9"
             existing_unknown_tag_data.post_count = 0
+            self.tag_list_model.add_to_search_index(existing_unknown_tag_data) # Unknown tags aren't indexed, so index it now
             # Notify observers about the change
             existing_unknown_tag_data.notify_observers()
             self.tag_list_model.tag_state_changed.emit(underscored_tag_name)
@@ -737,18 +900,16 @@ class MainWindow(QMainWindow):
             List of TagData objects (known tags from model or newly created unknown tags)
         """
         result_tag_data_list = []
+        tags_by_name = self.tag_list_model.tags_by_name # Holds every tag in the model, kept in sync by add_tag/remove_unknown_tags
         
         for tag_name in tag_names:
             # Find existing TagData in current model
-            existing_tag_data = None
-            for tag in self.tag_list_model.get_all_tags():
-                if tag.name == tag_name:
-                    existing_tag_data = tag
-                    break
+            existing_tag_data = tags_by_name.get(tag_name)
 
             if existing_tag_data:
-                # Known tag found in model
-                self.tag_list_model.set_tag_selected_state(tag_name, True)
+                # Known tag found in model. It may still be selected from the previous image, then it needs no update
+                if not existing_tag_data.selected:
+                    self.tag_list_model.set_tag_selected_state(tag_name, True)
                 result_tag_data_list.append(existing_tag_data)
             else:
                 # Unknown tag: create TagData object (is_known=False)
@@ -767,7 +928,7 @@ class MainWindow(QMainWindow):
         self.current_tag_source = source_type
         
         # Reload tags from new source
-        csv_path = os.path.join(os.getcwd(), "data", f"{source_type}-tags-list.csv")
+        csv_path = os.path.join(DATA_DIR, f"{source_type}-tags-list.csv")
         self.tag_list_model.switch_tag_source(csv_path)
         
         # Reload favorites with new tag model. We only load favorites that exist in the currently loaded model
@@ -777,27 +938,36 @@ class MainWindow(QMainWindow):
         if self.current_image_path and self.selected_tags_for_current_image:
             current_tag_names = [tag.name for tag in self.selected_tags_for_current_image]
             self.selected_tags_for_current_image = []
-            self.tag_list_model.clear_selected_tags()
-            self.tag_list_model.remove_unknown_tags()
-            
-            self.selected_tags_for_current_image = self._process_tag_names_for_selection(current_tag_names)
+            self.tag_list_model.begin_batch()
+            try:
+                self.tag_list_model.clear_selected_tags()
+                self.tag_list_model.remove_unknown_tags()
+
+                self.selected_tags_for_current_image = self._process_tag_names_for_selection(current_tag_names)
+            finally:
+                self.tag_list_model.end_batch()
             self.update_workfile_for_current_image()
         
         # Full UI refresh
         self._update_tag_panels()
 
-app = QApplication(sys.argv)
-theme.setup_dark_mode(app)
+def main():
+    """Creates the application and main window, then runs the event loop."""
+    app = QApplication(sys.argv)
+    theme.setup_dark_mode(app)
+
+    # Create main window
+    window_start_time = time.time()
+    window = MainWindow()
+    window_end_time = time.time()
+    print(f"MainWindow initialization took {window_end_time - window_start_time:.4f} seconds")
 
-# Create main window
-window_start_time = time.time()
-window = MainWindow()
-window_end_time = time.time()
-print(f"MainWindow initialization took {window_end_time - window_start_time:.4f} seconds")
+    # Show window
+    window.show()
+    app_ready_time = time.time()
+    print(f"Total application startup time: {app_ready_time - app_start_time:.4f} seconds")
 
-# Show window
-window.show()
-app_ready_time = time.time()
-print(f"Total application startup time: {app_ready_time - app_start_time:.4f} seconds")
+    sys.exit(app.exec())
 
-app.exec()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
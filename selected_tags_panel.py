@@ -1,10 +1,15 @@
+import logging
 from PySide6.QtWidgets import QHBoxLayout, QPushButton, QWidget, QApplication
 from PySide6.QtGui import QAction, QIcon
 from PySide6.QtCore import QSize
 from tag_list_panel import TagListPanel
 from file_operations import FileOperations
 
+logger = logging.getLogger(__name__)
+
 class SelectedTagsPanel(TagListPanel):
+    TAGS_DRAGGABLE = True # Tags can be reordered by dragging
+
     def __init__(self, main_window, parent=None):
         super().__init__(main_window, panel_title="Selected Tags")
         self.setAcceptDrops(True)  # This panel accepts drops
@@ -84,7 +89,7 @@ class SelectedTagsPanel(TagListPanel):
 
     def is_tag_draggable(self, tag_name):
         """Always allow dragging in this panel."""
-        return True
+        return self.TAGS_DRAGGABLE
 
     def _get_bulk_operations(self):
         """Returns list of allowed bulk operations for this panel."""
@@ -101,6 +106,6 @@ class SelectedTagsPanel(TagListPanel):
     def _handle_post_drop_update(self, tag_name, original_index, new_index):
         """Update workfile after tag order changes."""
         self.main_window.update_workfile_for_current_image()
-        print("  Workfile updated with new tag order.")
+        logger.debug("  Workfile updated with new tag order.")
 
     
\ No newline at end of file
@@ -1,9 +1,18 @@
-from PySide6.QtCore import QAbstractListModel, Qt, QModelIndex, Signal
+import logging
+import os
+import pickle
+from PySide6.QtCore import QAbstractListModel, Qt, QModelIndex, Signal, QObject, QRunnable, Slot
 from operator import attrgetter
 from file_operations import FileOperations
 from heapq import nlargest
+from bisect import bisect_left, insort
+
+logger = logging.getLogger(__name__)
 
 class TagData:
+    # Tens of thousands of these are loaded from the CSV; slots drop the per-instance __dict__
+    __slots__ = ('name', 'category', 'post_count', 'selected', 'favorite', 'is_known', 'observers')
+
     def __init__(self, name, category=None, post_count=None, selected=False, favorite=False, is_known=True):
         self.name = name
         self.category = category
@@ -38,6 +47,130 @@ class TagData:
                     self.observers.remove(callback)
 
 
+def _load_tag_rows_cache(cache_path, csv_key):
+    """Returns the cached (name, category, post_count) rows for a tag CSV, or None if the cache is missing or stale."""
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_key, tag_rows = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Ignoring unreadable tag cache {cache_path}: {e}")
+        return None
+    if cached_key != csv_key:
+        return None # The CSV was replaced or edited since the cache was written
+    return tag_rows
+
+def _save_tag_rows_cache(cache_path, csv_key, tag_rows):
+    """Writes the parsed rows of a tag CSV next to it, so the next start can skip parsing."""
+    temp_path = cache_path + '.tmp'
+    try:
+        with open(temp_path, 'wb') as f:
+            pickle.dump((csv_key, tag_rows), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path) # Never leave a half-written cache behind
+    except OSError as e:
+        print(f"Could not write tag cache {cache_path}: {e}")
+
+def parse_tags_csv(csv_path):
+    """Parses a tag CSV file into TagData objects.
+
+    The parsed rows are cached in a pickle next to the CSV, keyed by the CSV's mtime and size,
+    so later starts skip the CSV parsing and validation.
+    Doesn't touch any model or Qt state, so it is safe to call off the GUI thread.
+
+    Returns:
+        list: TagData objects in file order, empty if the file couldn't be read
+    """
+    import csv
+    import time
+
+    start_time = time.time()
+    print(f"Loading tags from CSV: {csv_path}")
+
+    try:
+        csv_stat = os.stat(csv_path)
+        csv_key = (csv_stat.st_mtime_ns, csv_stat.st_size)
+        cache_path = csv_path + '.pkl'
+        tag_rows = _load_tag_rows_cache(cache_path, csv_key)
+        if tag_rows is not None:
+            tags_to_add = [TagData(name=name, category=category, post_count=post_count) for name, category, post_count in tag_rows]
+            end_time = time.time()
+            print(f"Loaded {len(tags_to_add)} tags from cache in {end_time - start_time:.4f} seconds.")
+            return tags_to_add
+
+        # Create a set of existing tag names for faster duplicate checking
+        existing_tag_names = set()
+
+        # Read the whole file in one call and parse the in-memory lines; much cheaper than DictReader on a file object
+        with open(csv_path, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+
+        header = next(csv.reader(lines[:1]), [])
+        try:
+            name_column = header.index('name')
+            category_column = header.index('category')
+            post_count_column = header.index('post_count')
+        except ValueError as e:
+            print(f"Error: CSV header is missing a required column: {e}")
+            return []
+
+        # Preallocate list capacity for better performance
+        tags_to_add = []
+        tag_rows = [] # Validated rows, saved as the cache for the next start
+
+        for line in lines[1:]:
+            if not line:
+                continue  # Skip blank lines, as DictReader did
+            # Almost no row quotes anything, so a plain split does; the csv module only parses rows with quotes
+            row = line.split(',') if '"' not in line else next(csv.reader((line,)))
+            # Extract data from CSV, handling potential errors
+            try:
+                name = row[name_column]
+                category = row[category_column]
+                post_count = int(row[post_count_column])  # Convert to integer
+            except (IndexError, ValueError) as e:
+                print(f"Skipping row due to error: {e} - Row data: {row}")
+                continue  # Skip to the next row
+
+            # Check for duplicates by name using set (O(1) lookup)
+            if name in existing_tag_names:
+                print(f"Duplicate tag found: {name}, skipping.")
+                continue
+
+            existing_tag_names.add(name)
+            tag_data = TagData(name=name, category=category, post_count=post_count)
+            tags_to_add.append(tag_data)
+            tag_rows.append((name, category, post_count))
+
+        _save_tag_rows_cache(cache_path, csv_key, tag_rows)
+
+        end_time = time.time()
+        print(f"Loaded {len(tags_to_add)} tags from CSV in {end_time - start_time:.4f} seconds.")
+        return tags_to_add
+    except FileNotFoundError:
+        print(f"Error: CSV file not found at {csv_path}")
+    except Exception as e:
+        print(f"Error loading tags from CSV: {e}")
+    return []
+
+class TagCsvLoadSignals(QObject):
+    """Signals for the tag CSV load worker."""
+    loaded = Signal(str, object)  # csv path, list of TagData
+
+class TagCsvLoadWorker(QRunnable):
+    """Parses a tag CSV on a background thread. The model itself is only updated on the GUI thread."""
+
+    def __init__(self, csv_path):
+        super().__init__()
+        self.csv_path = csv_path
+        self.signals = TagCsvLoadSignals()
+
+    @Slot()
+    def run(self):
+        """Parses the CSV and emits the tags."""
+        self.signals.loaded.emit(self.csv_path, parse_tags_csv(self.csv_path))
+
+
 class TagListModel(QAbstractListModel):
     """A model to hold a list of tags."""
 
@@ -51,56 +184,59 @@ class TagListModel(QAbstractListModel):
         # Search index for quick lookups
         self.search_index = {}  # Maps lowercase tag name segments to lists of TagData objects
         self.tags_by_name = {}  # Maps tag name to TagData for O(1) lookups
+        self._selected_tags = set()  # TagData objects with selected=True, so clearing doesn't walk every tag
+        self._unknown_tags = set()  # TagData objects added with is_known=False, so removing them doesn't walk every tag
+        # Substring search state from the previous fuzzy query, so a query that extends it only rescans its matches
+        self._last_search_query = None
+        self._last_matching_keys = None
+        # Maps each two-character substring to the search_index keys containing it, in index order.
+        # Built lazily on the first substring scan, then kept up to date as keys are added.
+        self._key_bigram_index = None
+        # All search_index keys in sorted order, so prefix lookups are a bisect. Built lazily like the bigram index.
+        self._sorted_index_keys = None
+        # Batch state: while _batch_depth > 0, tags_selected_changed is held back and sent once by end_batch
+        self._batch_depth = 0
+        self._batch_selection_changed = False
+
+    def begin_batch(self):
+        """Starts a batch of selection changes. tags_selected_changed is emitted once, when the batch ends.
+
+        Per-tag observers and tag_state_changed still fire for every change, so widgets restyle as before.
+        Batches can be nested; only the outermost end_batch emits.
+        """
+        self._batch_depth += 1
+
+    def end_batch(self):
+        """Ends a batch started with begin_batch, emitting tags_selected_changed if anything changed during it."""
+        self._batch_depth -= 1
+        if self._batch_depth == 0 and self._batch_selection_changed:
+            self._batch_selection_changed = False
+            self.tags_selected_changed.emit()
+
+    def _emit_tags_selected_changed(self):
+        """Emits tags_selected_changed, or records it for end_batch while a batch is open."""
+        if self._batch_depth:
+            self._batch_selection_changed = True
+        else:
+            self.tags_selected_changed.emit()
 
     def load_tags_from_csv(self, csv_path):
         """Loads tags from the specified CSV file."""
-        import csv
-        import time
-        
-        start_time = time.time()
-        print(f"Loading tags from CSV: {csv_path}")
-        
-        try:
-            # Create a set of existing tag names for faster duplicate checking
-            existing_tag_names = set()
-            
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                # Preallocate list capacity for better performance
-                tags_to_add = []
-                
-                for row in reader:
-                    # Extract data from CSV, handling potential errors
-                    try:
-                        name = row['name']
-                        category = row['category']
-                        post_count = int(row['post_count'])  # Convert to integer
-                    except (KeyError, ValueError) as e:
-                        print(f"Skipping row due to error: {e} - Row data: {row}")
-                        continue  # Skip to the next row
-
-                    # Check for duplicates by name using set (O(1) lookup)
-                    if name in existing_tag_names:
-                        print(f"Duplicate tag found: {name}, skipping.")
-                        continue
-                    
-                    existing_tag_names.add(name)
-                    tag_data = TagData(name=name, category=category, post_count=post_count)
-                    tags_to_add.append(tag_data)
-                
-                # Extend the list at once instead of appending one by one
-                self.tags.extend(tags_to_add)
-                
-                # Build the search index
-                self._build_search_index()
+        self.add_loaded_tags(parse_tags_csv(csv_path))
+
+    def add_loaded_tags(self, tag_data_list):
+        """Adds tags parsed by parse_tags_csv to the model and rebuilds the search index.
+
+        Args:
+            tag_data_list (list): TagData objects, e.g. from a TagCsvLoadWorker
+        """
+        # Extend the list at once instead of appending one by one
+        self.tags.extend(tag_data_list)
+
+        # Build the search index
+        self._build_search_index()
+        print(f"Added {len(tag_data_list)} tags from CSV, {len(self.tags)} tags in model.")
 
-            end_time = time.time()
-            print(f"Loaded {len(self.tags)} tags from CSV in {end_time - start_time:.4f} seconds.")
-        except FileNotFoundError:
-            print(f"Error: CSV file not found at {csv_path}")
-        except Exception as e:
-            print(f"Error loading tags from CSV: {e}")
-            
     def _build_search_index(self):
         """Builds the search index for faster tag lookup."""
         import time
@@ -111,29 +247,20 @@ class TagListModel(QAbstractListModel):
         # Clear existing indexes
         self.search_index = {}
         self.tags_by_name = {}
+        self._last_search_query = None # Cached matches refer to the old index
+        self._last_matching_keys = None
+        self._key_bigram_index = None
+        self._sorted_index_keys = None
         
         for tag_data in self.tags:
+            # Add to tags_by_name dictionary for O(1) lookups. Unknown tags too, name lookups must find every tag in the model
+            self.tags_by_name[tag_data.name] = tag_data
+
             if not tag_data.is_known:
                 continue  # Skip unknown tags in the index
-                
-            # Add to tags_by_name dictionary for O(1) lookups
-            self.tags_by_name[tag_data.name] = tag_data
             
             # Add to search index
-            tag_name_spaces = FileOperations.convert_underscores_to_spaces(tag_data.name.lower())
-            
-            # Index the full tag name
-            if tag_name_spaces not in self.search_index:
-                self.search_index[tag_name_spaces] = []
-            self.search_index[tag_name_spaces].append(tag_data)
-            
-            # Index each word separately for better substring matching
-            words = tag_name_spaces.split()
-            for word in words:
-                if word not in self.search_index:
-                    self.search_index[word] = []
-                if tag_data not in self.search_index[word]:
-                    self.search_index[word].append(tag_data)
+            self.add_to_search_index(tag_data)
                     
         end_time = time.time()
         print(f"Search index built in {end_time - start_time:.4f} seconds. Indexed {len(self.search_index)} terms.")
@@ -147,6 +274,14 @@ class TagListModel(QAbstractListModel):
         """Returns all tags."""
         return self.tags
 
+    def get_selected_tag_count(self):
+        """Returns how many tags are selected, without walking the tag list."""
+        return len(self._selected_tags)
+
+    def get_unknown_tags(self):
+        """Returns the tags in the model that aren't known (not from the CSV)."""
+        return [tag for tag in self._unknown_tags if not tag.is_known] # Promoted tags are still in the set until the next removal
+
     def get_favorite_tags(self):
         """Returns all tags."""
         return [tag for tag in self.tags if tag.favorite]
@@ -157,32 +292,48 @@ class TagListModel(QAbstractListModel):
         
         # Update tags_by_name dictionary
         self.tags_by_name[tag_data.name] = tag_data
+
+        if tag_data.selected:
+            self._selected_tags.add(tag_data) # e.g. unknown tags created already selected for the current image
+        if not tag_data.is_known:
+            self._unknown_tags.add(tag_data)
         
         # Only add known tags to the search index
         if tag_data.is_known:
-            # Add to search index
-            tag_name_spaces = FileOperations.convert_underscores_to_spaces(tag_data.name.lower())
-            
-            # Index the full tag name
-            if tag_name_spaces not in self.search_index:
-                self.search_index[tag_name_spaces] = []
-            self.search_index[tag_name_spaces].append(tag_data)
-            
-            # Index each word separately
-            words = tag_name_spaces.split()
-            for word in words:
-                if word not in self.search_index:
-                    self.search_index[word] = []
-                if tag_data not in self.search_index[word]:
-                    self.search_index[word].append(tag_data)
+            self.add_to_search_index(tag_data)
+
+    def add_to_search_index(self, tag_data):
+        """Indexes a known tag under its full lowercase space-separated name and each of its words."""
+        self._last_search_query = None # New keys may match the cached query, so it can't be narrowed from anymore
+        self._last_matching_keys = None
+        tag_name_spaces = FileOperations.convert_underscores_to_spaces(tag_data.name.lower())
+        
+        # Index the full tag name
+        if tag_name_spaces not in self.search_index:
+            self.search_index[tag_name_spaces] = []
+            self._add_new_index_key(tag_name_spaces)
+        self.search_index[tag_name_spaces].append(tag_data)
+        
+        # Index each word separately for better substring matching
+        words = tag_name_spaces.split()
+        for word in words:
+            if word not in self.search_index:
+                self.search_index[word] = []
+                self._add_new_index_key(word)
+            if tag_data not in self.search_index[word]:
+                self.search_index[word].append(tag_data)
 
     def remove_tag(self, tag_data_to_remove):
         """Removes a specific TagData object from the tag list."""
         if tag_data_to_remove in self.tags:
             self.beginResetModel() # Or beginRemoveRows/endRemoveRows for more specific signal
             self.tags.remove(tag_data_to_remove)
+            self._selected_tags.discard(tag_data_to_remove)
+            self._unknown_tags.discard(tag_data_to_remove)
+            if self.tags_by_name.get(tag_data_to_remove.name) is tag_data_to_remove:
+                del self.tags_by_name[tag_data_to_remove.name] # Keep name lookups in sync with the tag list
             self.endResetModel() # Or endRemoveRows
-            self.tags_selected_changed.emit() # Notify panels of change
+            self._emit_tags_selected_changed() # Notify panels of change
             print(f"Tag '{tag_data_to_remove.name}' removed from TagListModel.")
         else:
             print(f"Warning: Tag '{tag_data_to_remove.name}' not found in TagListModel for removal.")
@@ -190,28 +341,50 @@ class TagListModel(QAbstractListModel):
     def clear_tags(self):
         """Clears all tags."""
         self.tags = []
+        self._selected_tags = set()
+        self._unknown_tags = set()
     
     def set_tag_selected_state(self, tag_name, is_tag_selected):
         """Set the current selection state for a given tag."""
-        tag = next((tag for tag in self.tags if tag.name == tag_name), None)
+        tag = self.tags_by_name.get(tag_name)
         if tag:
             tag.selected = is_tag_selected
+            if is_tag_selected:
+                self._selected_tags.add(tag)
+            else:
+                self._selected_tags.discard(tag)
             tag.notify_observers()  # Notify observers of this specific tag
             self.tag_state_changed.emit(tag_name)  # Emit signal with tag name
-            self.tags_selected_changed.emit()  # Keep existing signal for backward compatibility TODO: is anything broken if this is removed? check search panel
+            self._emit_tags_selected_changed()  # Keep existing signal for backward compatibility TODO: is anything broken if this is removed? check search panel
+
+    def remove_unknown_tags(self, keep_tag_names=None):
+        """Removes any tags where is_known is False from the tag list and tags_by_name dict.
 
-    def remove_unknown_tags(self):
-        """Removes any tags where is_known is False from the tag list and tags_by_name dict."""
-        # Identify unknown tags to remove
-        unknown_tags = [tag for tag in self.tags if not tag.is_known]
+        Args:
+            keep_tag_names (set, optional): Names of unknown tags to keep, e.g. the ones the next image
+                shares with the current one, so they aren't removed and created again
+        """
+        self._unknown_tags = {tag for tag in self._unknown_tags if not tag.is_known} # Drop tags promoted to known
+        unknown_tags = {tag for tag in self._unknown_tags if not keep_tag_names or tag.name not in keep_tag_names}
+        if not unknown_tags:
+            return # Nothing to remove, skip walking the tag list
+        self._unknown_tags -= unknown_tags
 
-        # Remove from the main tags list
-        self.tags = [tag for tag in self.tags if tag.is_known]
+        # Remove from the main tags list. Unknown tags are appended after the CSV tags, so walk from the end
+        # and stop once all of them are found, rather than rebuilding the whole list
+        remaining = set(unknown_tags)
+        for i in range(len(self.tags) - 1, -1, -1):
+            if self.tags[i] in remaining:
+                remaining.discard(self.tags[i])
+                del self.tags[i]
+                if not remaining:
+                    break
 
         # Also remove unknown tags from the tags_by_name dictionary
         for tag in unknown_tags:
-            if tag.name in self.tags_by_name:
+            if self.tags_by_name.get(tag.name) is tag:
                 del self.tags_by_name[tag.name]
+            self._selected_tags.discard(tag)
 
     def rowCount(self, parent=QModelIndex()):
         """Returns the number of rows (tags)."""
@@ -221,11 +394,23 @@ class TagListModel(QAbstractListModel):
         """Returns data for a specific item and role."""
         return None # Modified
     
-    def clear_selected_tags(self):
-        """Resets the 'selected' status of all tags to False."""
-        for tag in self.tags:
-            tag.selected = False
-        self.tags_selected_changed.emit() # Notify any listeners
+    def clear_selected_tags(self, keep_tag_names=None):
+        """Resets the 'selected' status of all tags to False.
+
+        Args:
+            keep_tag_names (set, optional): Names of tags to leave selected, e.g. the tags the next image
+                shares with the current one, so their widgets aren't restyled off and straight back on
+        """
+        selected_tags = self._selected_tags
+        self._selected_tags = set()
+        for tag in selected_tags: # Only the tags that are actually selected, not the whole list
+            if keep_tag_names and tag.name in keep_tag_names:
+                self._selected_tags.add(tag)
+                continue
+            if tag.selected:
+                tag.selected = False
+                tag.notify_observers() # Panels reuse their TagWidgets, so they must restyle themselves
+        self._emit_tags_selected_changed() # Notify any listeners
 
     def get_known_tags(self):
         """Returns a list of all known tags."""
@@ -252,23 +437,32 @@ class TagListModel(QAbstractListModel):
         result_set = set()  # Use a set to avoid duplicates
             
         if exact_match:
-            # For exact match, we need to find tags where the ENTIRE name equals our query
-            # We can't just use the index directly, as it might match partial words
-            for tag_data in self.get_known_tags():
+            # For exact match, we need to find tags where the ENTIRE name equals our query.
+            # Every known tag is indexed under its full lowercase name, so the index entry for the query
+            # holds all candidates; it may also hold tags that merely contain the query as a word, so re-check those.
+            for tag_data in self.search_index.get(query_spaces, ()):
                 # Convert tag name to space format just like the query
                 tag_name_spaces = FileOperations.convert_underscores_to_spaces(tag_data.name.lower())
                 if tag_name_spaces == query_spaces:  # Exact equality check
                     result_set.add(tag_data)
         else:
             # Fuzzy match - find all tags that contain the query
-            # Check each key in the search index that contains our query
-            matching_keys = [key for key in self.search_index.keys() if query_spaces in key]
-            
-            # If the query is a single letter or short string, this could return too many results
-            # For very short queries, we can optimize by doing a more targeted search
+            # Check each key in the search index that contains our query. While typing, the new query usually extends
+            # the previous one, and any key containing it must also have contained the previous query, so only those are rescanned.
             if len(query_spaces) <= 2:
-                # For short queries, limit to keys that start with the query
-                matching_keys = [key for key in matching_keys if key.startswith(query_spaces)]
+                # A single letter or short string would match too many keys as a substring,
+                # so short queries only match keys that start with the query
+                matching_keys = self._find_keys_starting_with(query_spaces)
+                # Prefix matches can't be narrowed into the substring matches of a longer query
+                self._last_search_query = None
+                self._last_matching_keys = None
+            else:
+                if self._last_search_query is not None and query_spaces.startswith(self._last_search_query):
+                    matching_keys = [key for key in self._last_matching_keys if query_spaces in key]
+                else:
+                    matching_keys = self._find_keys_containing(query_spaces)
+                self._last_search_query = query_spaces
+                self._last_matching_keys = matching_keys
             
             # Add all tags from matching keys to our result set
             for key in matching_keys:
@@ -291,10 +485,64 @@ class TagListModel(QAbstractListModel):
         filtered_tags = filtered_tags[:MAX_SEARCH_RESULTS]
         
         end_time = time.time()
-        print(f"Search for '{query}' took {end_time - start_time:.4f} seconds with {total_matches} matches (showing {len(filtered_tags)})")
+        # Runs on every (debounced) keystroke, so only format the timing when debug logging is on
+        logger.debug("Search for '%s' took %.4f seconds with %s matches (showing %s)", query, end_time - start_time, total_matches, len(filtered_tags))
         
         return filtered_tags
     
+    def _find_keys_containing(self, needle):
+        """Returns every search index key containing needle (at least 2 characters), in index order.
+
+        Only the keys holding the needle's rarest two-character substring are checked, which is
+        usually a few hundred keys instead of every key in the index.
+        """
+        if self._key_bigram_index is None:
+            self._key_bigram_index = {}
+            for key in self.search_index:
+                self._add_key_to_bigram_index(key)
+
+        bigram_index = self._key_bigram_index
+        if len(needle) == 2:
+            return list(bigram_index.get(needle, ())) # The posting list is exactly the keys containing it
+
+        candidate_keys = min((bigram_index.get(needle[i:i + 2], ()) for i in range(len(needle) - 1)), key=len)
+        return [key for key in candidate_keys if needle in key]
+
+    def _find_keys_starting_with(self, prefix):
+        """Returns every search index key starting with prefix, in sorted order.
+
+        The matching keys are one contiguous run of the sorted key list, so this is a bisect
+        plus a walk over the matches instead of a startswith test on every key.
+        """
+        if self._sorted_index_keys is None:
+            self._sorted_index_keys = sorted(self.search_index)
+
+        sorted_keys = self._sorted_index_keys
+        matching_keys = []
+        for i in range(bisect_left(sorted_keys, prefix), len(sorted_keys)):
+            key = sorted_keys[i]
+            if not key.startswith(prefix):
+                break # Past the run of keys sharing the prefix
+            matching_keys.append(key)
+        return matching_keys
+
+    def _add_new_index_key(self, key):
+        """Keeps the lazily built lookup structures up to date when a key is added to search_index."""
+        self._add_key_to_bigram_index(key)
+        if self._sorted_index_keys is not None:
+            insort(self._sorted_index_keys, key)
+
+    def _add_key_to_bigram_index(self, key):
+        """Adds a new search index key to the posting list of each two-character substring it contains."""
+        if self._key_bigram_index is None:
+            return # Not built yet, the first substring scan indexes every key
+        for bigram in {key[i:i + 2] for i in range(len(key) - 1)}:
+            keys_with_bigram = self._key_bigram_index.get(bigram)
+            if keys_with_bigram is None:
+                self._key_bigram_index[bigram] = [key]
+            else:
+                keys_with_bigram.append(key)
+
     def increment_tag_usage(self, tag_name):
         """Increments the usage count for a given tag name."""
         underscored_tag_name = FileOperations.convert_spaces_to_underscores(tag_name) # Convert to underscore format for consistency
@@ -302,21 +550,24 @@ class TagListModel(QAbstractListModel):
             self.tag_usage_counts[underscored_tag_name] += 1 # Increment existing count
         else:
             self.tag_usage_counts[underscored_tag_name] = 1 # Initialize count to 1 if tag is new to usage data
-        print(f"  Tag usage count incremented for '{underscored_tag_name}': {self.tag_usage_counts[underscored_tag_name]}") # Debug message
+        logger.debug("  Tag usage count incremented for '%s': %s", underscored_tag_name, self.tag_usage_counts[underscored_tag_name])
 
     def get_frequent_tags(self, top_n=30):
         """
         Returns the top `top_n` most frequently used tags, ordered by usage count, then post_count, then name.
         """
-        # Step 1: Build a list of (primary, secondary, tertiary, TagData) tuples
-        frequent_tag_tuples = [
-            (self.tag_usage_counts.get(tag.name, 0),  # Usage count (primary sort key)
-            tag.post_count,                             # post_count (secondary tie-breaker)
-            tag.name,                                    # Tag name (tertiary tie-breaker)
-            tag)                                         # TagData object
-            for tag in self.get_known_tags() # <--- Filter for known tags here
-            if tag.name in self.tag_usage_counts # <--- Ensure tag has usage data
-        ]
+        # Step 1: Build a list of (primary, secondary, tertiary, TagData) tuples.
+        # Walks the usage data and looks each tag up by name, rather than building a list of every known tag
+        frequent_tag_tuples = []
+        for tag_name, usage_count in self.tag_usage_counts.items():
+            tag = self.tags_by_name.get(tag_name)
+            if tag is None or not tag.is_known: # <--- Only known tags in the model
+                continue
+            frequent_tag_tuples.append((
+                usage_count,     # Usage count (primary sort key)
+                tag.post_count,  # post_count (secondary tie-breaker)
+                tag.name,        # Tag name (tertiary tie-breaker)
+                tag))            # TagData object
 
         # Step 2: Get the top `top_n` using heapq.nlargest()
         top_tags = [tag for _, _, _, tag in nlargest(top_n, frequent_tag_tuples)]
@@ -341,6 +592,8 @@ class TagListModel(QAbstractListModel):
         self.tags = []
         self.search_index = {}
         self.tags_by_name = {}
+        self._selected_tags = set()
+        self._unknown_tags = set()
         
         # Load new source
         self.load_tags_from_csv(csv_path)
@@ -1,12 +1,19 @@
+import logging
 from abc import ABC, abstractmethod
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QSizePolicy, QScrollArea
 from PySide6.QtCore import Qt, Slot
 from PySide6.QtGui import QKeyEvent
 from tag_widget import TagWidget
 
+logger = logging.getLogger(__name__)
+
 class TagListPanel(QWidget, ABC, metaclass=type('ABCMetaQWidget', (type(QWidget), type(ABC)), {})):  # Explicit metaclass
     """Abstract base class for tag list panels."""
 
+    # Whether this panel lets tags be reordered by dragging. Subclasses whose is_tag_draggable can return True
+    # set this, so drag events can check the panel without asking every tag
+    TAGS_DRAGGABLE = False
+
     def __init__(self, main_window=None, panel_title=""):
         super().__init__(main_window)
         self.main_window = main_window
@@ -42,6 +49,11 @@ class TagListPanel(QWidget, ABC, metaclass=type('ABCMetaQWidget', (type(QWidget)
         # Set the container as the scroll area's widget
         self.scroll_area.setWidget(self.tags_container)
         
+        # Maps tag name -> TagWidget currently shown in this panel, so updates can reuse widgets
+        self._tag_widgets_by_name = {}
+        # Set when update_display was skipped because the panel was hidden (e.g. a background tab); showEvent catches up
+        self._display_outdated = False
+
         # Drag and drop properties
         self.drop_indicator_line = None  # Initialize drop indicator line as None
         self.dragged_tag_name = None  # Track the tag being dragged
@@ -49,6 +61,12 @@ class TagListPanel(QWidget, ABC, metaclass=type('ABCMetaQWidget', (type(QWidget)
         # Connect to resize events to update tags when container size changes
         self.scroll_area.resizeEvent = self._on_scroll_area_resize
 
+    def showEvent(self, event):
+        """Catches up on an update_display call skipped while the panel was hidden."""
+        super().showEvent(event)
+        if self._display_outdated:
+            self.update_display()
+
     @abstractmethod
     def _get_tag_data_list(self):
         """Abstract method: Subclasses must implement to return the list of TagData objects."""
@@ -60,22 +78,71 @@ class TagListPanel(QWidget, ABC, metaclass=type('ABCMetaQWidget', (type(QWidget)
         pass
 
     def update_display(self):
-        """Template method: Updates the panel display."""
-        self._clear_widgets()  # Clear existing widgets (using helper method)
+        """Template method: Updates the panel display.
+
+        Existing TagWidgets are reused, so only tags that entered or left the list
+        are created or destroyed. Widgets whose position changed are moved in place.
+        While the panel is hidden the update is skipped, and done when the panel is shown again.
+        """
+        if not self.isVisible():
+            self._display_outdated = True # Nothing to look at, don't build the list or its widgets yet
+            return
+        self._display_outdated = False
+
         tag_data_list = self._get_tag_data_list() # Get tag data from subclass
 
-        for tag_data in tag_data_list:
-            tag_widget = self._create_tag_widget(tag_data) # Create and configure TagWidget
-            self.layout.addWidget(tag_widget) # Add to container layout
+        # Freeze repaints while widgets are added/moved so the layout is only recomputed once at the end
+        self.tags_container.setUpdatesEnabled(False)
+        try:
+            self._sync_tag_widgets(tag_data_list)
+        finally:
+            self.tags_container.setUpdatesEnabled(True)
+        self.layout.activate()
+
+    def _sync_tag_widgets(self, tag_data_list):
+        """Helper method: Brings the layout's TagWidgets in line with tag_data_list."""
+        wanted_tags = {tag_data.name: tag_data for tag_data in tag_data_list}
+
+        # Drop widgets for tags that left the list (or whose TagData object was replaced, e.g. after a tag source switch)
+        for tag_name, tag_widget in list(self._tag_widgets_by_name.items()):
+            if wanted_tags.get(tag_name) is not tag_widget.tag_data:
+                self._remove_tag_widget(tag_name)
+
+        for index, tag_data in enumerate(tag_data_list):
+            tag_widget = self._tag_widgets_by_name.get(tag_data.name)
+            if tag_widget is None:
+                tag_widget = self._create_tag_widget(tag_data) # Create and configure TagWidget
+                self._tag_widgets_by_name[tag_data.name] = tag_widget
+                self.layout.insertWidget(index, tag_widget)
+                continue
+
+            layout_item = self.layout.itemAt(index)
+            if layout_item is None or layout_item.widget() is not tag_widget:
+                # Tag was reordered, move the existing widget instead of rebuilding it
+                self.layout.removeWidget(tag_widget)
+                self.layout.insertWidget(index, tag_widget)
+            if tag_widget.isHidden():
+                tag_widget.show() # Widgets hide themselves while being dragged
+
+    def _remove_tag_widget(self, tag_name):
+        """Helper method: Removes and deletes the TagWidget shown for the given tag name."""
+        tag_widget = self._tag_widgets_by_name.pop(tag_name, None)
+        if tag_widget is None:
+            return
+        tag_widget.cleanup()
+        self.layout.removeWidget(tag_widget)
+        tag_widget.deleteLater()
 
     def _clear_widgets(self):
         """Helper method: Clears existing TagWidgets from the layout."""
+        self._tag_widgets_by_name = {}
         for i in reversed(range(self.layout.count())):
             widget = self.layout.itemAt(i).widget()
             if widget is not None:
                 if hasattr(widget, 'cleanup'):
                     widget.cleanup()
-                self.layout.removeWidget(widget)
+                # takeAt(i) drops the item by index; removeWidget would search the layout for it, O(n^2) over the loop
+                self.layout.takeAt(i)
                 widget.deleteLater()
 
     def _create_tag_widget(self, tag_data):
@@ -101,18 +168,18 @@ class TagListPanel(QWidget, ABC, metaclass=type('ABCMetaQWidget', (type(QWidget)
         # Check if dragging is allowed in this panel for the tag being dragged
         if event.mimeData().hasText() and self._is_any_tag_draggable():
             event.acceptProposedAction()
-            print("Drag Enter Event: Drag accepted for text data.")
+            logger.debug("Drag Enter Event: Drag accepted for text data.")
             
             # Store the dragged tag name
             self.dragged_tag_name = event.mimeData().text()
-            print(f"  Dragged tag name: {self.dragged_tag_name}")
+            logger.debug("  Dragged tag name: %s", self.dragged_tag_name)
 
             # Initialize or reset drop indicator
             self._ensure_drop_indicator_exists()
             self.drop_indicator_line.hide() # Ensure hidden at drag start
         else:
             event.ignore()
-            print("Drag Enter Event: Drag ignored - no text data or panel does not support dragging.")
+            logger.debug("Drag Enter Event: Drag ignored - no text data or panel does not support dragging.")
 
     def dragMoveEvent(self, event):
         """Handles drag move events for the panel, updating drop indicator."""
@@ -134,21 +201,22 @@ class TagListPanel(QWidget, ABC, metaclass=type('ABCMetaQWidget', (type(QWidget)
             self.drop_indicator_line.show()
         else:
             event.ignore()
-            print("Drag Move Event: Drag ignored - no text data or panel does not support dragging.")
+            logger.debug("Drag Move Event: Drag ignored - no text data or panel does not support dragging.") # Fires per mouse move
 
     def dragLeaveEvent(self, event):
         """Handles drag leave events."""
-        print("Drag Leave Event: Hiding indicator")
+        logger.debug("Drag Leave Event: Hiding indicator")
         if self.drop_indicator_line:
             self.drop_indicator_line.hide() # Hide the indicator when drag leaves
         self.dragged_tag_name = None  # Reset dragged tag name
         
     def _is_any_tag_draggable(self):
-        """Helper method to check if this panel supports dragging any tags."""
-        for tag_data in self._get_tag_data_list():
-            if self.is_tag_draggable(tag_data.name):
-                return True
-        return False
+        """Helper method to check if this panel supports dragging any tags.
+
+        Called on every drag move, so it checks the class constant instead of calling
+        is_tag_draggable per tag (and building the tag list for panels that can't drag at all).
+        """
+        return self.TAGS_DRAGGABLE and bool(self._get_tag_data_list())
         
     def _ensure_drop_indicator_exists(self):
         """Helper method to initialize the drop indicator line if it doesn't exist yet."""
@@ -221,7 +289,7 @@ class TagListPanel(QWidget, ABC, metaclass=type('ABCMetaQWidget', (type(QWidget)
         """Handles drop events for the panel, implementing tag reordering."""
         if event.mimeData().hasText() and self._is_any_tag_draggable() and self.is_tag_draggable(event.mimeData().text()):
             tag_name = event.mimeData().text()
-            print(f"Drop Event: Tag '{tag_name}' dropped!")
+            logger.debug("Drop Event: Tag '%s' dropped!", tag_name)
 
             if self.drop_indicator_line:
                 self.drop_indicator_line.hide() # Hide indicator on drop
@@ -254,7 +322,7 @@ class TagListPanel(QWidget, ABC, metaclass=type('ABCMetaQWidget', (type(QWidget)
                 
                 # Insert at the target position
                 self._insert_tag_into_data_list(dragged_tag_data, drop_index)
-                print(f"  Tag '{tag_name}' reordered from {dragged_tag_orig_index} to {drop_index}")
+                logger.debug("  Tag '%s' reordered from %s to %s", tag_name, dragged_tag_orig_index, drop_index)
 
                 # Update appropriate data (file, workfile, etc.)
                 self._handle_post_drop_update(tag_name, dragged_tag_orig_index, drop_index)
@@ -268,7 +336,7 @@ class TagListPanel(QWidget, ABC, metaclass=type('ABCMetaQWidget', (type(QWidget)
             self.update_display()
         else:
             event.ignore()
-            print("Drop Event: Drop ignored - panel doesn't support dragging or tag not draggable.")
+            logger.debug("Drop Event: Drop ignored - panel doesn't support dragging or tag not draggable.")
 
     @abstractmethod
     def _remove_tag_from_data_list(self, tag_data):
@@ -311,12 +379,9 @@ class TagListPanel(QWidget, ABC, metaclass=type('ABCMetaQWidget', (type(QWidget)
         from PySide6.QtWidgets import QMenu
         from PySide6.QtGui import QCursor, QAction
         
-        # Find tag data for the clicked tag
-        tag_data = None
-        for td in self._get_tag_data_list():
-            if td.name == tag_name:
-                tag_data = td
-                break
+        # Find tag data for the clicked tag through its widget (dict lookup instead of scanning the data list)
+        tag_widget = self._tag_widgets_by_name.get(tag_name)
+        tag_data = tag_widget.tag_data if tag_widget is not None else None
         
         if not tag_data:
             print(f"Warning: Tag data not found for right-clicked tag '{tag_name}'")
@@ -389,11 +454,6 @@ class TagListPanel(QWidget, ABC, metaclass=type('ABCMetaQWidget', (type(QWidget)
         
     def _update_tag_widgets_elided_text(self):
         """Update elided text in all tag widgets in this panel."""
-        # Find all TagWidget instances in the container
-        for i in range(self.layout.count()):
-            widget_item = self.layout.itemAt(i)
-            if widget_item and widget_item.widget():
-                tag_widget = widget_item.widget()
-                # Check if it's a TagWidget with _update_elided_text method
-                if hasattr(tag_widget, '_update_elided_text'):
-                    tag_widget._update_elided_text()
\ No newline at end of file
+        # Every TagWidget in the container is in _tag_widgets_by_name, no need to walk the layout items
+        for tag_widget in self._tag_widgets_by_name.values():
+            tag_widget._update_elided_text()
\ No newline at end of file
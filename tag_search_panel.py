@@ -14,7 +14,10 @@ class TagSearchPanel(QWidget):
         self.search_query = ""
         self.highlighted_tag_index = -1 # Initialize highlighted index to -1 (no tag highlighted initially)
         self.search_results_tag_widgets = [] # Store TagWidgets in search results for navigation
+        self.highlighted_tag_widget = None # TagWidget currently carrying the highlight style
         self.exact_match_mode = False   # Initialize exact match mode to False (fuzzy search by default)
+        self.displayed_tag_data = []  # TagData objects currently shown, used to skip rebuilding identical results
+        self.displayed_query = ""  # Query the current results were built for (the "Add New Tag" button shows it)
         self.setup_ui()
         self._display_search_results([])
         self.main_window.tag_list_model.tags_selected_changed.connect(self._on_tags_changed)
@@ -142,16 +145,39 @@ class TagSearchPanel(QWidget):
         Clears the current results and displays the provided list of TagData objects as TagWidgets.
         Displays "Add New Tag" button if no results are found.
         """
+        # Freeze repaints while the result widgets are swapped so the layout is only recomputed once
+        self.results_area.setUpdatesEnabled(False)
+        try:
+            self._populate_search_results(tag_data_list)
+        finally:
+            self.results_area.setUpdatesEnabled(True)
+        self.results_area_layout.activate()
+
+    def _populate_search_results(self, tag_data_list):
+        """Helper method: Replaces the result widgets with TagWidgets for tag_data_list.
+
+        TagWidgets for tags that are still in the results are reused (typing usually narrows the
+        previous results), everything else is deleted.
+        """
+        wanted_tags = {tag_data.name: tag_data for tag_data in tag_data_list}
+        reusable_tag_widgets = {}
         for i in reversed(range(self.results_area_layout.count())):
             widget = self.results_area_layout.itemAt(i).widget()
             if widget is not None:
+                self.results_area_layout.takeAt(i) # By index; removeWidget would search the layout for the widget
+                if isinstance(widget, TagWidget) and wanted_tags.get(widget.tag_name) is widget.tag_data:
+                    reusable_tag_widgets[widget.tag_name] = widget
+                    continue
+                if widget is self.highlighted_tag_widget:
+                    self.highlighted_tag_widget = None
                 if hasattr(widget, 'cleanup'):
                     widget.cleanup()
-                self.results_area_layout.removeWidget(widget)
                 widget.deleteLater()
 
         self.search_results_tag_widgets = []
         self.highlighted_tag_index = -1
+        self.displayed_tag_data = list(tag_data_list)
+        self.displayed_query = self.search_query
 
         if not tag_data_list: # Check if tag_data_list is empty (no results)
             if self.search_query: # Check if search_query is NOT empty
@@ -162,13 +188,15 @@ class TagSearchPanel(QWidget):
                 self.results_area_layout.addWidget(no_results_label)
 
         else: # If there are search results (tag_data_list is not empty)
-            # Display new TagWidgets from the provided list (Existing code - no change here)
+            # Display TagWidgets for the provided list, creating only the ones not already shown
             for tag_data in tag_data_list:
-                tag_widget = TagWidget(tag_data=tag_data)
-                tag_widget.set_styling_mode("dim_on_select")
-                tag_widget.tag_clicked.connect(self.main_window._handle_tag_clicked)
-                tag_widget.favorite_star_clicked.connect(self.main_window._handle_favorite_star_clicked)
-                tag_widget.tag_right_clicked.connect(self._handle_tag_right_clicked)
+                tag_widget = reusable_tag_widgets.pop(tag_data.name, None)
+                if tag_widget is None:
+                    tag_widget = TagWidget(tag_data=tag_data)
+                    tag_widget.set_styling_mode("dim_on_select")
+                    tag_widget.tag_clicked.connect(self.main_window._handle_tag_clicked)
+                    tag_widget.favorite_star_clicked.connect(self.main_window._handle_favorite_star_clicked)
+                    tag_widget.tag_right_clicked.connect(self._handle_tag_right_clicked)
                 self.results_area_layout.addWidget(tag_widget)
                 self.search_results_tag_widgets.append(tag_widget)
                 
@@ -202,6 +230,11 @@ class TagSearchPanel(QWidget):
         Implements debounce to delay the search execution.
         """
         self.search_query = text # Store the search query
+        if not text:
+            # Clearing the box needs no search, only the shown results dropped, so skip the debounce
+            self.search_timer.stop()
+            self._execute_search()
+            return
         self.search_timer.start(250) # Start debounce timer with 250ms delay
 
     def _execute_search(self):
@@ -212,17 +245,19 @@ class TagSearchPanel(QWidget):
         """
         query_text = self.search_query # Retrieve stored search query
         if not query_text: # Check if search query is empty
-            self._display_search_results([]) # Display empty results area if query is empty
-        else:
-            filtered_tags = self.main_window.tag_list_model.search_tags(query_text, self.exact_match_mode) # Perform search
-            self._display_search_results(filtered_tags) # Update UI with search results
+            # Empty search fast path: nothing to match, and tag changes can't affect an empty results area
+            if self.displayed_tag_data or self.displayed_query:
+                self._display_search_results([]) # Drop the previous results (and "Add New Tag" button)
+            return
 
-        if self.search_results_tag_widgets: # Check if there are results to highlight
-            self.highlighted_tag_index = 0 # Highlight the first tag (index 0)
-            self._update_tag_highlight() # Update the visual highlight
-        else:
-            self.highlighted_tag_index = -1 # No results, reset highlight index
-            self._update_tag_highlight() # Ensure no tag is highlighted
+        filtered_tags = self.main_window.tag_list_model.search_tags(query_text, self.exact_match_mode) # Perform search
+
+        # Tag clicks re-run the search; when the results are unchanged the existing widgets already restyle
+        # themselves through their TagData observers, so leave them (and the highlight) alone
+        if filtered_tags == self.displayed_tag_data and (filtered_tags or query_text == self.displayed_query):
+            return
+
+        self._display_search_results(filtered_tags) # Update UI with search results, which also resets the highlight
 
     def keyPressEvent(self, event: QKeyEvent):
         """Handles key press events for keyboard navigation and delegates to KeyboardManager."""
@@ -254,12 +289,22 @@ class TagSearchPanel(QWidget):
         # --- End Delegation ---
 
     def _update_tag_highlight(self):
-        """Updates the visual highlight of the currently highlighted tag."""
-        for index, tag_widget in enumerate(self.search_results_tag_widgets):
-            if index == self.highlighted_tag_index:
-                tag_widget.setStyleSheet("border: 2px solid grey;") # Highlight style
-            else:
-                tag_widget.setStyleSheet("") # Reset to default style
+        """Updates the visual highlight of the currently highlighted tag.
+
+        Only the previously and newly highlighted widgets are restyled, since every stylesheet change re-polishes the widget.
+        """
+        if 0 <= self.highlighted_tag_index < len(self.search_results_tag_widgets):
+            new_highlighted_widget = self.search_results_tag_widgets[self.highlighted_tag_index]
+        else:
+            new_highlighted_widget = None
+
+        if new_highlighted_widget is self.highlighted_tag_widget:
+            return
+        if self.highlighted_tag_widget is not None:
+            self.highlighted_tag_widget.set_highlighted(False)
+        if new_highlighted_widget is not None:
+            new_highlighted_widget.set_highlighted(True)
+        self.highlighted_tag_widget = new_highlighted_widget
 
     def _handle_add_new_tag_button_clicked(self):
         """Handles clicks on the "Add New Tag" button (no search results)."""
@@ -309,11 +354,7 @@ class TagSearchPanel(QWidget):
         from PySide6.QtGui import QCursor, QAction
 
         # Find tag data for the clicked tag
-        tag_data = None
-        for td in self.main_window.tag_list_model.tags:
-            if td.name == tag_name:
-                tag_data = td
-                break
+        tag_data = self.main_window.tag_list_model.tags_by_name.get(tag_name)
 
         if not tag_data:
             print(f"Warning: Tag data not found for right-clicked tag '{tag_name}'")
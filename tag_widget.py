@@ -1,9 +1,12 @@
+import logging
 from PySide6.QtWidgets import QLabel, QFrame, QSizePolicy, QHBoxLayout
 from PySide6.QtCore import Qt, QSize, Signal, QMimeData, QPoint
 from PySide6.QtGui import QDrag, QFont, QPixmap, QContextMenuEvent
 from math import sqrt
 from file_operations import FileOperations
 from theme import TAG_CATEGORY_COLORS
+
+logger = logging.getLogger(__name__)
 class TagWidget(QFrame):
     """Widget to display a tag."""
 
@@ -25,6 +28,7 @@ class TagWidget(QFrame):
         self.is_selected = is_selected if is_selected is not None else tag_data.selected # Use constructor param if provided, else TagData
         self.is_known_tag = is_known_tag if is_known_tag is not None else tag_data.is_known # Use constructor param if provided, else TagData
         self.styling_mode = "dim_on_select"
+        self.is_highlighted = False # Keyboard highlight in the search results
         self._setup_ui()
         self._update_style()
         
@@ -43,6 +47,8 @@ class TagWidget(QFrame):
         if self._is_cleaned_up:
             return
         self._is_cleaned_up = True
+        # Nothing this widget emits between now and its deleteLater is wanted, e.g. a queued click reaching a removed tag
+        self.blockSignals(True)
 
         try:
             self.tag_clicked.disconnect()
@@ -123,21 +129,21 @@ class TagWidget(QFrame):
         if event.button() == Qt.LeftButton:
             self.start_drag_pos = event.pos()  # Record starting position
             self.start_drag_global_pos = event.globalPos() # Needed for calculating global distance
-            print(f"Mouse press event. tag: {self.tag_name}, pos: {self.start_drag_pos}, global: {self.start_drag_global_pos}") # Debug
+            logger.debug("Mouse press event. tag: %s, pos: %s, global: %s", self.tag_name, self.start_drag_pos, self.start_drag_global_pos)
 
     def mouseMoveEvent(self, event):
         """Handles mouse move events to initiate drag operation."""
-        print(f"mouseMoveEvent called for tag: {self.tag_name}") # Debug
+        logger.debug("mouseMoveEvent called for tag: %s", self.tag_name)
 
         if event.buttons() != Qt.LeftButton: # Check if left button is still pressed
-            print(f"mouseMoveEvent: Ignoring because left button is not pressed.") #Debug
+            logger.debug("mouseMoveEvent: Ignoring because left button is not pressed.")
             return # Ignore if not left button drag
 
         dx = event.globalPos().x() - self.start_drag_global_pos.x() # Calculate horizontal movement
         dy = event.globalPos().y() - self.start_drag_global_pos.y() # Calculate vertical movement
         distance = sqrt(dx * dx + dy * dy) # Calculate total distance using hypotenuse
 
-        print(f"mouseMoveEvent: tag={self.tag_name}, distance={distance:.2f}") # Debug
+        logger.debug("mouseMoveEvent: tag=%s, distance=%.2f", self.tag_name, distance)
 
         # Get the parent panel to check if the tag is draggable
         parent_panel = self.parent()
@@ -148,10 +154,10 @@ class TagWidget(QFrame):
         is_draggable = False
         if parent_panel and hasattr(parent_panel, 'is_tag_draggable'):
             is_draggable = parent_panel.is_tag_draggable(self.tag_name)
-            print(f"Tag '{self.tag_name}' draggable: {is_draggable}")
+            logger.debug("Tag '%s' draggable: %s", self.tag_name, is_draggable)
         
         if distance > 8: # Drag threshold (pixels) - Always initiate a drag to allow "escape" from misclicks
-            print(f"Initiating drag for tag: {self.tag_name}") # Debug
+            logger.debug("Initiating drag for tag: %s", self.tag_name)
             drag = QDrag(self) # Create QDrag object, passing self (TagWidget) as parent
             mime_data = QMimeData() # Create QMimeData object to hold drag data
             mime_data.setText(self.tag_name) # For now, just tag name as plain text
@@ -189,23 +195,23 @@ class TagWidget(QFrame):
             
             if is_draggable:
                 if drop_action == Qt.MoveAction:
-                    print(f"Drag successful for tag: {self.tag_name}. MoveAction returned.") # Debug - successful drop
+                    logger.debug("Drag successful for tag: %s. MoveAction returned.", self.tag_name)
                     # Drop was handled by a target, no need to show tag again here.
                 else:
-                    print(f"Drag cancelled/invalid for tag: {self.tag_name}. Action: {drop_action}") # Debug - cancelled/invalid drop
+                    logger.debug("Drag cancelled/invalid for tag: %s. Action: %s", self.tag_name, drop_action)
                     self.show()
             
-            print(f"Drag operation completed for tag: {self.tag_name}") # Debug
+            logger.debug("Drag operation completed for tag: %s", self.tag_name)
 
     def mouseReleaseEvent(self, event):
         """Handles mouse release events."""
-        print(f"TagWidget '{self.tag_name}' mouseReleaseEvent!")
+        logger.debug("TagWidget '%s' mouseReleaseEvent!", self.tag_name)
         if event.button() == Qt.LeftButton:  # Only handle left clicks
             if self.star_label.geometry().contains(event.pos()): # Check if click is within star_label
-                print(f"Star icon clicked for tag: {self.tag_name}") # Debug
+                logger.debug("Star icon clicked for tag: %s", self.tag_name)
                 self.favorite_star_clicked.emit(self.tag_name) # Emit favorite_star_clicked signal
             else:
-                print(f"Tag label clicked for tag: {self.tag_name}") # Debug
+                logger.debug("Tag label clicked for tag: %s", self.tag_name)
                 self.tag_clicked.emit(self.tag_name)  # Emit the tag_clicked signal (existing functionality)
         super().mouseReleaseEvent(event) # keep default functionality just in case
 
@@ -247,8 +253,22 @@ class TagWidget(QFrame):
 
         # --- Apply the Combined Stylesheet to label ---
         self.tag_label.setStyleSheet(style)
-        # Setting a separate stylesheet for the widget itself to set tooltip colors. Baindaid because I did a bad job setting overall styling in this app
-        self.setStyleSheet("QToolTip { color: #FFFFFF; background-color: #353535; border: 1px solid #555555; }")
+        self._update_widget_style_sheet()
+
+    def _update_widget_style_sheet(self):
+        """Applies the stylesheet of the widget itself (tooltip colors, or the keyboard highlight border)."""
+        if self.is_highlighted:
+            self.setStyleSheet("border: 2px solid grey;") # Highlight style
+        else:
+            # Setting a separate stylesheet for the widget itself to set tooltip colors. Baindaid because I did a bad job setting overall styling in this app
+            self.setStyleSheet("QToolTip { color: #FFFFFF; background-color: #353535; border: 1px solid #555555; }")
+
+    def set_highlighted(self, is_highlighted):
+        """Sets the keyboard highlight state. Only the widget's own stylesheet is touched, the label keeps its style."""
+        if is_highlighted == self.is_highlighted:
+            return
+        self.is_highlighted = is_highlighted
+        self._update_widget_style_sheet()
 
 
     def set_selected(self, is_selected):
@@ -307,7 +327,7 @@ class TagWidget(QFrame):
     def contextMenuEvent(self, event: QContextMenuEvent):
         """Handles right-click context menu events for the TagWidget."""
         if event.reason() == QContextMenuEvent.Mouse:
-            print(f"Right-click detected on tag: {self.tag_name}")
+            logger.debug("Right-click detected on tag: %s", self.tag_name)
             self.tag_right_clicked.emit(self.tag_name)
             event.accept()
         else:
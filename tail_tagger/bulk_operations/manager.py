@@ -1,5 +1,4 @@
 import os
-import json
 import shutil
 from datetime import datetime
 
@@ -205,8 +204,8 @@ class BulkOperationsManager:
 
         # Save workfile
         try:
-            with open(workfile_path, 'w', encoding='utf-8') as f:
-                json.dump(workfile_data, f, indent=2)
+            self.file_operations.write_workfile(workfile_path, workfile_data)
+            self.file_operations.invalidate_workfile_cache(folder_path) # Next load must see the bulk changes
             print(f"Saved workfile: {workfile_path}")
         except Exception as e:
             print(f"Error saving workfile: {e}")
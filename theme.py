@@ -1,3 +1,4 @@
+from functools import cache
 from PySide6.QtGui import QColor, QPalette
 from PySide6.QtCore import Qt
 
@@ -14,9 +15,9 @@ TAG_CATEGORY_COLORS = {
     "9": "#555555"   # New/Unknown category
 }
 
-def setup_dark_mode(app):
-    """Sets up the application-wide dark mode theme."""
-    app.setStyle("Fusion")  # Use the Fusion style for a consistent look.
+@cache
+def _dark_palette():
+    """Builds the dark mode palette once; later calls return the same QPalette."""
     dark_palette = QPalette()
     dark_color = QColor(53, 53, 53)
     dark_disabled_color = QColor(127, 127, 127)
@@ -38,4 +39,9 @@ def setup_dark_mode(app):
     dark_palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
     dark_palette.setColor(QPalette.Disabled, QPalette.Highlight, dark_disabled_color)
     dark_palette.setColor(QPalette.HighlightedText, Qt.white)
-    app.setPalette(dark_palette)
\ No newline at end of file
+    return dark_palette
+
+def setup_dark_mode(app):
+    """Sets up the application-wide dark mode theme."""
+    app.setStyle("Fusion")  # Use the Fusion style for a consistent look.
+    app.setPalette(_dark_palette())